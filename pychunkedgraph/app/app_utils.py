@@ -8,6 +8,7 @@ from functools import wraps
 import numpy as np
 import networkx as nx
 import requests
+from cachetools import LRUCache
 from flask import current_app, json, request
 from scipy import spatial
 from werkzeug.datastructures import ImmutableMultiDict
@@ -18,7 +19,9 @@ from pychunkedgraph.graph.client import get_default_client_info
 from pychunkedgraph.graph import exceptions as cg_exceptions
 
 
-PCG_CACHE = {}
+# bounded so a long-lived worker serving many tables doesn't
+# hold a client per table forever
+PCG_CACHE = LRUCache(maxsize=32)
 
 
 def get_app_base_path():
@@ -170,6 +173,12 @@ def get_cg(table_id, skip_cache: bool = False):
     raise ValueError(f"Graph {cg.graph_id} not supported.")
 
 
+def parse_bounds(bounds: str) -> np.ndarray:
+    """Parse a "x1-x2_y1-y2_z1-z2" query parameter into a (2, 3) array."""
+    coords = bounds.replace("_", "-").split("-")
+    return np.fromiter(map(int, coords), dtype=np.int64, count=6).reshape(3, 2).T
+
+
 def toboolean(value):
     """Transform value to boolean type.
     :param value: bool/int/str
@@ -200,7 +209,7 @@ def tobinary(ids):
     :param ids: uint64 or list of uint64s
     :return: binary
     """
-    return np.array(ids).tobytes()
+    return np.asarray(ids).tobytes()
 
 
 def tobinary_multiples(arr):
@@ -209,7 +218,7 @@ def tobinary_multiples(arr):
     :param arr: list of uint64 or list of uint64s
     :return: binary
     """
-    return [np.array(arr_i).tobytes() for arr_i in arr]
+    return [np.asarray(arr_i).tobytes() for arr_i in arr]
 
 
 def handle_supervoxel_id_lookup(
@@ -228,11 +237,11 @@ def handle_supervoxel_id_lookup(
         ccs = [np.array(list(cc)) for cc in nx.connected_components(graph)]
         return ccs
 
-    coordinates = np.array(coordinates, dtype=int)
+    coordinates = np.asarray(coordinates).astype(int, copy=False)
     coordinates_nm = coordinates * cg.meta.resolution
     max_dist_steps = np.array([4, 8, 14, 28], dtype=float) * np.mean(cg.meta.resolution)
 
-    node_ids = np.array(node_ids, dtype=np.uint64)
+    node_ids = np.asarray(node_ids, dtype=np.uint64)
     if len(coordinates.shape) != 2:
         raise cg_exceptions.BadRequest(
             f"Could not determine supervoxel ID for coordinates "
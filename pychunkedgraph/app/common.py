@@ -49,7 +49,8 @@ def _log_request(response_time):
 
 
 def before_request():
-    current_app.request_start_time = time.time()
+    # single wall-clock read; perf_counter is monotonic for durations
+    current_app.request_start_time = time.perf_counter()
     current_app.request_start_date = datetime.utcnow()
     try:
         current_app.user_id = g.auth_user["id"]
@@ -64,7 +65,7 @@ def before_request():
 
 
 def after_request(response):
-    response_time = (time.time() - current_app.request_start_time) * 1000
+    response_time = (time.perf_counter() - current_app.request_start_time) * 1000
     accept_encoding = request.headers.get("Accept-Encoding", "")
 
     _log_request(response_time)
@@ -89,12 +90,12 @@ def after_request(response):
 
 def unhandled_exception(e):
     status_code = 500
-    response_time = (time.time() - current_app.request_start_time) * 1000
+    response_time = (time.perf_counter() - current_app.request_start_time) * 1000
     user_ip = str(request.remote_addr)
-    tb = traceback.format_exception(e)
 
     _log_request(response_time)
 
+    # let the logger format the traceback lazily via exc_info
     current_app.logger.error(
         {
             "message": str(e),
@@ -105,10 +106,11 @@ def unhandled_exception(e):
             "request_data": request.data,
             "response_time": response_time,
             "response_code": status_code,
-            "traceback": tb,
-        }
+        },
+        exc_info=e,
     )
 
+    tb = traceback.format_exception(e)
     resp = {
         "timestamp": current_app.request_start_date,
         "duration": response_time,
@@ -121,9 +123,8 @@ def unhandled_exception(e):
 
 
 def api_exception(e):
-    response_time = (time.time() - current_app.request_start_time) * 1000
+    response_time = (time.perf_counter() - current_app.request_start_time) * 1000
     user_ip = str(request.remote_addr)
-    tb = traceback.format_exception(e)
 
     _log_request(response_time)
 
@@ -137,8 +138,8 @@ def api_exception(e):
             "request_data": request.data,
             "response_time": response_time,
             "response_code": e.status_code.value,
-            "traceback": tb,
-        }
+        },
+        exc_info=e,
     )
 
     resp = {
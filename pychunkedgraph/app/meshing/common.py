@@ -1,7 +1,6 @@
 # pylint: disable=invalid-name, missing-docstring
 import json
 import os
-import threading
 
 import numpy as np
 import redis
@@ -16,6 +15,7 @@ from pychunkedgraph.meshing import meshgen
 from pychunkedgraph.meshing.manifest import get_highest_child_nodes_with_meshes
 from pychunkedgraph.meshing.manifest import get_children_before_start_layer
 from pychunkedgraph.meshing.manifest import ManifestCache
+from pychunkedgraph.meshing.enqueue import mesh_enqueue_buffer
 
 
 __meshing_url_prefix__ = os.environ.get("MESHING_URL_PREFIX", "meshing")
@@ -64,8 +64,7 @@ def handle_get_manifest(table_id, node_id):
 
     bounding_box = None
     if "bounds" in request.args:
-        bounds = request.args["bounds"]
-        bounding_box = np.array([b.split("-") for b in bounds.split("_")], dtype=int).T
+        bounding_box = app_utils.parse_bounds(request.args["bounds"])
 
     cg = app_utils.get_cg(table_id)
     verify = request.args.get("verify", False)
@@ -166,19 +165,22 @@ def handle_remesh(table_id):
         return jsonify(response_object), 202
     else:
         new_lvl2_ids = np.array(new_lvl2_ids, dtype=np.uint64)
-        cg = app_utils.get_cg(table_id)
 
         if len(new_lvl2_ids) > 0:
-            t = threading.Thread(
-                target=_remeshing, args=(cg.get_serialized_info(), new_lvl2_ids)
+            # offload to mesh workers; remeshing is CPU-bound and would
+            # block the request thread under the GIL
+            mesh_enqueue_buffer.enqueue(
+                _remeshing,
+                args=(table_id, new_lvl2_ids),
+                job_timeout="10m",
             )
-            t.start()
 
         return Response(status=202)
 
 
-def _remeshing(serialized_cg_info, lvl2_nodes):
-    cg = chunkedgraph.ChunkedGraph(**serialized_cg_info)
+def _remeshing(table_id, lvl2_nodes):
+    # graph is constructed in the worker, off the request path
+    cg = chunkedgraph.ChunkedGraph(graph_id=table_id)
     cv_mesh_dir = cg.meta.dataset_info["mesh"]
     cv_unsharded_mesh_dir = cg.meta.dataset_info["mesh_metadata"]["unsharded_mesh_dir"]
     cv_unsharded_mesh_path = os.path.join(
@@ -197,8 +199,6 @@ def _remeshing(serialized_cg_info, lvl2_nodes):
         cv_unsharded_mesh_path=cv_unsharded_mesh_path,
     )
 
-    return Response(status=200)
-
 
 def clear_manifest_cache(cg, node_id):
     node_ids = get_children_before_start_layer(cg, node_id, start_layer=2)
@@ -1,6 +1,5 @@
 # pylint: disable=invalid-name, missing-docstring
 
-import json
 import os
 import time
 from datetime import datetime
@@ -8,6 +7,7 @@ from functools import reduce
 from collections import deque, defaultdict
 
 import numpy as np
+import orjson
 import pandas as pd
 from flask import current_app, g, jsonify, make_response, request
 from pytz import UTC
@@ -78,11 +78,23 @@ def _parse_timestamp(
 
 def _get_bounds_from_request(request):
     if "bounds" in request.args:
-        bounds = request.args["bounds"]
-        bounding_box = np.array([b.split("-") for b in bounds.split("_")], dtype=int).T
-    else:
-        bounding_box = None
-    return bounding_box
+        return app_utils.parse_bounds(request.args["bounds"])
+    return None
+
+
+def _parse_source_sink_nodes(cg, data):
+    """Pack sources/sinks into preallocated arrays; idents are 0/1."""
+    n_sources = len(data["sources"])
+    count = n_sources + len(data["sinks"])
+    node_ids = np.empty(count, dtype=np.uint64)
+    coords = np.empty((count, 3), dtype=np.float64)
+    node_idents = np.zeros(count, dtype=int)
+    node_idents[n_sources:] = 1
+    for i, node in enumerate(data["sources"] + data["sinks"]):
+        node_ids[i] = node[0]
+        coords[i] = node[1:]
+    coords /= cg.segmentation_resolution
+    return node_ids, coords, node_idents
 
 
 # -------------------
@@ -155,7 +167,7 @@ def handle_find_minimal_covering_nodes(table_id, is_binary=True):
     if is_binary:
         node_ids = np.frombuffer(request.data, np.uint64)
     else:
-        node_ids = np.array(json.loads(request.data)["node_ids"], dtype=np.uint64)
+        node_ids = np.array(orjson.loads(request.data)["node_ids"], dtype=np.uint64)
 
     # Input parameters
     timestamp = _parse_timestamp("timestamp", time.time(), return_datetime=True)
@@ -244,7 +256,7 @@ def handle_roots(table_id, is_binary=False):
     if is_binary:
         node_ids = np.frombuffer(request.data, np.uint64)
     else:
-        node_ids = np.array(json.loads(request.data)["node_ids"], dtype=np.uint64)
+        node_ids = np.array(orjson.loads(request.data)["node_ids"], dtype=np.uint64)
     # Convert seconds since epoch to UTC datetime
     timestamp = _parse_timestamp("timestamp", time.time(), return_datetime=True)
 
@@ -348,7 +360,7 @@ def handle_merge(table_id, allow_same_segment_merge=False):
     current_app.table_id = table_id
     user_id = str(g.auth_user.get("id", current_app.user_id))
 
-    nodes = json.loads(request.data)
+    nodes = orjson.loads(request.data)
     is_priority = request.args.get("priority", True, type=str2bool)
     remesh = request.args.get("remesh", True, type=str2bool)
     chebyshev_distance = request.args.get("chebyshev_distance", 3, type=int)
@@ -358,19 +370,21 @@ def handle_merge(table_id, allow_same_segment_merge=False):
 
     # Call ChunkedGraph
     cg = app_utils.get_cg(table_id, skip_cache=True)
-    node_ids = []
-    coords = []
-    for node in nodes:
-        node_ids.append(node[0])
-        coords.append(np.array(node[1:]) / cg.segmentation_resolution)
+    node_ids = np.array([node[0] for node in nodes], dtype=np.uint64)
+    coords = np.array([node[1:] for node in nodes], dtype=np.float64)
+    coords /= cg.segmentation_resolution
 
     atomic_edge = app_utils.handle_supervoxel_id_lookup(cg, coords, node_ids)
     # Protection from long range mergers
-    chunk_coord_delta = cg.get_chunk_coordinates(
-        atomic_edge[0]
-    ) - cg.get_chunk_coordinates(atomic_edge[1])
+    coord0 = cg.get_chunk_coordinates(atomic_edge[0])
+    coord1 = cg.get_chunk_coordinates(atomic_edge[1])
+    chunk_coord_delta = max(
+        abs(int(coord0[0]) - int(coord1[0])),
+        abs(int(coord0[1]) - int(coord1[1])),
+        abs(int(coord0[2]) - int(coord1[2])),
+    )
 
-    if np.any(np.abs(chunk_coord_delta) > chebyshev_distance):
+    if chunk_coord_delta > chebyshev_distance:
         raise cg_exceptions.BadRequest(
             "Chebyshev distance between merge points exceeded allowed maximum "
             "(3 chunks)."
@@ -379,7 +393,7 @@ def handle_merge(table_id, allow_same_segment_merge=False):
     try:
         ret = cg.add_edges(
             user_id=user_id,
-            atomic_edges=np.array(atomic_edge, dtype=np.uint64),
+            atomic_edges=atomic_edge,
             source_coords=coords[:1],
             sink_coords=coords[1:],
             allow_same_segment_merge=allow_same_segment_merge,
@@ -411,7 +425,7 @@ def handle_split(table_id):
     current_app.table_id = table_id
     user_id = str(g.auth_user.get("id", current_app.user_id))
 
-    data = json.loads(request.data)
+    data = orjson.loads(request.data)
     is_priority = request.args.get("priority", True, type=str2bool)
     remesh = request.args.get("remesh", True, type=str2bool)
     mincut = request.args.get("mincut", True, type=str2bool)
@@ -420,23 +434,7 @@ def handle_split(table_id):
 
     # Call ChunkedGraph
     cg = app_utils.get_cg(table_id, skip_cache=True)
-    node_idents = []
-    node_ident_map = {
-        "sources": 0,
-        "sinks": 1,
-    }
-    coords = []
-    node_ids = []
-
-    for k in ["sources", "sinks"]:
-        for node in data[k]:
-            node_ids.append(node[0])
-            coords.append(np.array(node[1:]) / cg.segmentation_resolution)
-            node_idents.append(node_ident_map[k])
-
-    node_ids = np.array(node_ids, dtype=np.uint64)
-    coords = np.array(coords)
-    node_idents = np.array(node_idents)
+    node_ids, coords, node_idents = _parse_source_sink_nodes(cg, data)
     sv_ids = app_utils.handle_supervoxel_id_lookup(cg, coords, node_ids)
     current_app.logger.debug(
         {"node_id": node_ids, "sv_id": sv_ids, "node_ident": node_idents}
@@ -477,7 +475,7 @@ def handle_split(table_id):
 def handle_undo(table_id):
     current_app.table_id = table_id
 
-    data = json.loads(request.data)
+    data = orjson.loads(request.data)
     is_priority = request.args.get("priority", True, type=str2bool)
     remesh = request.args.get("remesh", True, type=str2bool)
     user_id = str(g.auth_user.get("id", current_app.user_id))
@@ -510,7 +508,7 @@ def handle_undo(table_id):
 def handle_redo(table_id):
     current_app.table_id = table_id
 
-    data = json.loads(request.data)
+    data = orjson.loads(request.data)
     is_priority = request.args.get("priority", True, type=str2bool)
     remesh = request.args.get("remesh", True, type=str2bool)
     user_id = str(g.auth_user.get("id", current_app.user_id))
@@ -549,7 +547,7 @@ def handle_rollback(table_id):
     is_priority = request.args.get("priority", True, type=str2bool)
     remesh = request.args.get("remesh", True, type=str2bool)
     skip_operation_ids = np.array(
-        json.loads(request.args.get("skip_operation_ids", "[]")), dtype=np.uint64
+        orjson.loads(request.args.get("skip_operation_ids", "[]")), dtype=np.uint64
     )
 
     # Call ChunkedGraph
@@ -731,7 +729,7 @@ def handle_leaves_many(table_id):
 
     bounding_box = _get_bounds_from_request(request)
 
-    node_ids = np.array(json.loads(request.data)["node_ids"], dtype=np.uint64)
+    node_ids = np.array(orjson.loads(request.data)["node_ids"], dtype=np.uint64)
     stop_layer = int(request.args.get("stop_layer", 1))
 
     # Call ChunkedGraph
@@ -766,7 +764,10 @@ def handle_leaves_from_leave(table_id, atomic_id):
         root_id, bbox=bounding_box, bbox_is_coordinate=True, nodes_only=True
     )
 
-    return np.concatenate([np.array([root_id]), atomic_ids])
+    resp = np.empty(len(atomic_ids) + 1, dtype=np.uint64)
+    resp[0] = root_id
+    resp[1:] = atomic_ids
+    return resp
 
 
 ### SUBGRAPH -------------------------------------------------------------------
@@ -929,7 +930,7 @@ def handle_lineage_graph(table_id, root_id=None):
 
     cg = app_utils.get_cg(table_id)
     if root_id is None:
-        root_ids = np.array(json.loads(request.data)["root_ids"], dtype=np.uint64)
+        root_ids = np.array(orjson.loads(request.data)["root_ids"], dtype=np.uint64)
         graph = lineage_graph(cg, root_ids, timestamp_past, timestamp_future)
         return node_link_data(graph)
     history_ids = segmenthistory.SegmentHistory(
@@ -939,7 +940,7 @@ def handle_lineage_graph(table_id, root_id=None):
 
 
 def handle_past_id_mapping(table_id):
-    root_ids = np.array(json.loads(request.data)["root_ids"], dtype=np.uint64)
+    root_ids = np.array(orjson.loads(request.data)["root_ids"], dtype=np.uint64)
     timestamp_past = _parse_timestamp(
         "timestamp_past", default_timestamp=0, return_datetime=True
     )
@@ -970,10 +971,32 @@ def last_edit(table_id, root_id):
 
 
 def oldest_timestamp(table_id):
+    from redis.exceptions import RedisError
+
+    from pychunkedgraph.utils.redis import get_redis_connection
+
     current_app.table_id = table_id
     user_id = str(g.auth_user.get("id", current_app.user_id))
     cg = app_utils.get_cg(table_id)
-    return cg.get_earliest_timestamp()
+
+    # stable per table; short-TTL redis cache saves the log scan on bursts
+    cache_key = f"pcg:oldest_ts:{table_id}"
+    redis = None
+    try:
+        redis = get_redis_connection()
+        cached = redis.get(cache_key)
+        if cached is not None:
+            return datetime.fromtimestamp(float(cached), UTC)
+    except RedisError:
+        ...
+
+    earliest_timestamp = cg.get_earliest_timestamp()
+    if redis is not None and earliest_timestamp is not None:
+        try:
+            redis.set(cache_key, earliest_timestamp.timestamp(), ex=60)
+        except RedisError:
+            ...
+    return earliest_timestamp
 
 
 ### CONTACT SITES --------------------------------------------------------------
@@ -1029,27 +1052,11 @@ def handle_split_preview(table_id):
     current_app.table_id = table_id
     user_id = str(g.auth_user.get("id", current_app.user_id))
 
-    data = json.loads(request.data)
+    data = orjson.loads(request.data)
     current_app.logger.debug(data)
 
     cg = app_utils.get_cg(table_id)
-    node_idents = []
-    node_ident_map = {
-        "sources": 0,
-        "sinks": 1,
-    }
-    coords = []
-    node_ids = []
-
-    for k in ["sources", "sinks"]:
-        for node in data[k]:
-            node_ids.append(node[0])
-            coords.append(np.array(node[1:]) / cg.segmentation_resolution)
-            node_idents.append(node_ident_map[k])
-
-    node_ids = np.array(node_ids, dtype=np.uint64)
-    coords = np.array(coords)
-    node_idents = np.array(node_idents)
+    node_ids, coords, node_idents = _parse_source_sink_nodes(cg, data)
     sv_ids = app_utils.handle_supervoxel_id_lookup(cg, coords, node_ids)
     current_app.logger.debug(
         {"node_id": node_ids, "sv_id": sv_ids, "node_ident": node_idents}
@@ -1081,17 +1088,15 @@ def handle_find_path(table_id, precision_mode):
     current_app.table_id = table_id
     user_id = str(g.auth_user.get("id", current_app.user_id))
 
-    nodes = json.loads(request.data)
+    nodes = orjson.loads(request.data)
     current_app.logger.debug(nodes)
     assert len(nodes) == 2
 
     # Call ChunkedGraph
     cg = app_utils.get_cg(table_id)
-    node_ids = []
-    coords = []
-    for node in nodes:
-        node_ids.append(node[0])
-        coords.append(np.array(node[1:]) / cg.segmentation_resolution)
+    node_ids = np.array([node[0] for node in nodes], dtype=np.uint64)
+    coords = np.array([node[1:] for node in nodes], dtype=np.float64)
+    coords /= cg.segmentation_resolution
 
     if len(coords) != 2:
         cg_exceptions.BadRequest("Merge needs two nodes.")
@@ -1154,7 +1159,7 @@ def handle_is_latest_roots(table_id, is_binary):
     if is_binary:
         node_ids = np.frombuffer(request.data, np.uint64)
     else:
-        node_ids = np.array(json.loads(request.data)["node_ids"], dtype=np.uint64)
+        node_ids = np.array(orjson.loads(request.data)["node_ids"], dtype=np.uint64)
     # Convert seconds since epoch to UTC datetime
     timestamp = _parse_timestamp("timestamp", time.time(), return_datetime=True)
 
@@ -1198,7 +1203,7 @@ def handle_root_timestamps(table_id, is_binary, latest: bool = False):
     if is_binary:
         node_ids = np.frombuffer(request.data, np.uint64)
     else:
-        node_ids = np.array(json.loads(request.data)["node_ids"], dtype=np.uint64)
+        node_ids = np.array(orjson.loads(request.data)["node_ids"], dtype=np.uint64)
 
     cg = app_utils.get_cg(table_id)
     timestamp = _parse_timestamp("timestamp", time.time(), return_datetime=True)
@@ -1217,7 +1222,7 @@ def operation_details(table_id):
 
     current_app.table_id = table_id
     user_id = str(g.auth_user.get("id", current_app.user_id))
-    operation_ids = json.loads(request.args.get("operation_ids", "[]"))
+    operation_ids = orjson.loads(request.args.get("operation_ids", "[]"))
 
     cg = app_utils.get_cg(table_id)
     log_rows = cg.client.read_log_entries(operation_ids)
@@ -1260,7 +1265,7 @@ def valid_nodes(table_id, is_binary):
     if is_binary:
         node_ids = np.frombuffer(request.data, np.uint64)
     else:
-        node_ids = np.array(json.loads(request.data)["node_ids"], dtype=np.uint64)
+        node_ids = np.array(orjson.loads(request.data)["node_ids"], dtype=np.uint64)
 
     # Convert seconds since epoch to UTC datetime
     end_timestamp = _parse_timestamp(
@@ -34,8 +34,7 @@ for layer in layers:
 
         segment_ids = np.random.randint(1, max_segment_id, n_segments_per_chunk)
 
-        for segment_id in segment_ids:
-            node_ids.append(cg.get_node_id(np.uint64(segment_id), np.uint64(chunk_id)))
+        node_ids.extend(np.uint64(chunk_id) | segment_ids.astype(np.uint64))
 
 rows = cg.client.read_nodes(node_ids=node_ids, end_time=timestamp, 
                             properties=attributes.Hierarchy.Parent)
@@ -43,6 +43,7 @@ class _AttributeArray:
         self._pattern = pattern
         self._family_id = family_id
         self._serializer = serializer
+        self._columns = {}
         _AttributeArray._attributearrays[(family_id, pattern)] = self
 
         # TODO: Add missing check in `fromkey(family_id, key)` and remove this
@@ -51,11 +52,16 @@ class _AttributeArray:
             self[i]  # pylint: disable=W0104
 
     def __getitem__(self, item):
-        return _Attribute(
-            key=self.pattern % item,
-            family_id=self._family_id,
-            serializer=self._serializer,
-        )
+        # indexed columns are requested per node on hot paths;
+        # creating (and re-registering) an _Attribute each time adds up
+        column = self._columns.get(item)
+        if column is None:
+            column = self._columns[item] = _Attribute(
+                key=self.pattern % item,
+                family_id=self._family_id,
+                serializer=self._serializer,
+            )
+        return column
 
     @property
     def pattern(self):
@@ -255,24 +261,28 @@ class OperationLogs:
 
     @staticmethod
     def all():
-        return [
-            OperationLogs.OperationID,
-            OperationLogs.UndoOperationID,
-            OperationLogs.RedoOperationID,
-            OperationLogs.UserID,
-            OperationLogs.RootID,
-            OperationLogs.SourceID,
-            OperationLogs.SinkID,
-            OperationLogs.SourceCoordinate,
-            OperationLogs.SinkCoordinate,
-            OperationLogs.BoundingBoxOffset,
-            OperationLogs.AddedEdge,
-            OperationLogs.RemovedEdge,
-            OperationLogs.Affinity,
-            OperationLogs.Status,
-            OperationLogs.OperationException,
-            OperationLogs.OperationTimeStamp,
-        ]
+        return _OPERATION_LOG_COLUMNS
+
+
+# built once at import; these are resolved per log read otherwise
+_OPERATION_LOG_COLUMNS = (
+    OperationLogs.OperationID,
+    OperationLogs.UndoOperationID,
+    OperationLogs.RedoOperationID,
+    OperationLogs.UserID,
+    OperationLogs.RootID,
+    OperationLogs.SourceID,
+    OperationLogs.SinkID,
+    OperationLogs.SourceCoordinate,
+    OperationLogs.SinkCoordinate,
+    OperationLogs.BoundingBoxOffset,
+    OperationLogs.AddedEdge,
+    OperationLogs.RemovedEdge,
+    OperationLogs.Affinity,
+    OperationLogs.Status,
+    OperationLogs.OperationException,
+    OperationLogs.OperationTimeStamp,
+)
 
 
 def from_key(family_id: str, key: bytes):
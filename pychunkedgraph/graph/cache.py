@@ -4,7 +4,6 @@ Cache nodes, parents, children and cross edges.
 from sys import maxsize
 from datetime import datetime
 
-from cachetools import cached
 from cachetools import LRUCache
 
 import numpy as np
@@ -24,16 +23,18 @@ def update(cache, keys, vals):
             cache[k] = vals
 
 
+def _contains_mask(cache, node_ids: np.ndarray) -> np.ndarray:
+    """Membership mask via direct dict lookups; materializing all cached
+    keys for np.in1d scales with cache size rather than request size."""
+    return np.fromiter(
+        (id_ in cache for id_ in node_ids), dtype=bool, count=len(node_ids)
+    )
+
+
 class CacheService:
     def __init__(self, cg):
         self._cg = cg
 
-        self._parent_vec = np.vectorize(self.parent, otypes=[np.uint64])
-        self._children_vec = np.vectorize(self.children, otypes=[np.ndarray])
-        self._atomic_cross_edges_vec = np.vectorize(
-            self.atomic_cross_edges, otypes=[dict]
-        )
-
         # no limit because we don't want to lose new IDs
         self.parents_cache = LRUCache(maxsize=maxsize)
         self.children_cache = LRUCache(maxsize=maxsize)
@@ -52,54 +53,58 @@ class CacheService:
         self.atomic_cx_edges_cache.clear()
 
     def parent(self, node_id: np.uint64, *, time_stamp: datetime = None):
-        @cached(cache=self.parents_cache, key=lambda node_id: node_id)
-        def parent_decorated(node_id):
-            return self._cg.get_parent(node_id, raw_only=True, time_stamp=time_stamp)
-
-        return parent_decorated(node_id)
+        try:
+            return self.parents_cache[node_id]
+        except KeyError:
+            parent = self._cg.get_parent(node_id, raw_only=True, time_stamp=time_stamp)
+            self.parents_cache[node_id] = parent
+            return parent
 
     def children(self, node_id):
-        @cached(cache=self.children_cache, key=lambda node_id: node_id)
-        def children_decorated(node_id):
+        try:
+            return self.children_cache[node_id]
+        except KeyError:
             children = self._cg.get_children(node_id, raw_only=True)
+            self.children_cache[node_id] = children
             update(self.parents_cache, children, node_id)
             return children
 
-        return children_decorated(node_id)
-
     def atomic_cross_edges(self, node_id):
-        @cached(cache=self.atomic_cx_edges_cache, key=lambda node_id: node_id)
-        def atomic_cross_edges_decorated(node_id):
+        try:
+            return self.atomic_cx_edges_cache[node_id]
+        except KeyError:
             edges = self._cg.get_atomic_cross_edges(
                 np.array([node_id], dtype=NODE_ID), raw_only=True
-            )
-            return edges[node_id]
-
-        return atomic_cross_edges_decorated(node_id)
+            )[node_id]
+            self.atomic_cx_edges_cache[node_id] = edges
+            return edges
 
     def parents_multiple(self, node_ids: np.ndarray, *, time_stamp: datetime = None):
         if not node_ids.size:
             return node_ids
-        mask = np.in1d(node_ids, np.fromiter(self.parents_cache.keys(), dtype=NODE_ID))
+        cache = self.parents_cache
+        mask = _contains_mask(cache, node_ids)
         parents = node_ids.copy()
-        parents[mask] = self._parent_vec(node_ids[mask])
-        parents[~mask] = self._cg.get_parents(
-            node_ids[~mask], raw_only=True, time_stamp=time_stamp
-        )
-        update(self.parents_cache, node_ids[~mask], parents[~mask])
+        parents[mask] = [cache[id_] for id_ in node_ids[mask]]
+        misses = node_ids[~mask]
+        if misses.size:
+            parents[~mask] = self._cg.get_parents(
+                misses, raw_only=True, time_stamp=time_stamp
+            )
+            update(cache, misses, parents[~mask])
         return parents
 
     def children_multiple(self, node_ids: np.ndarray, *, flatten=False):
         result = {}
         if not node_ids.size:
             return result
-        mask = np.in1d(node_ids, np.fromiter(self.children_cache.keys(), dtype=NODE_ID))
-        cached_children_ = self._children_vec(node_ids[mask])
-        result.update({id_: c_ for id_, c_ in zip(node_ids[mask], cached_children_)})
-        result.update(self._cg.get_children(node_ids[~mask], raw_only=True))
-        update(
-            self.children_cache, node_ids[~mask], [result[k] for k in node_ids[~mask]]
-        )
+        cache = self.children_cache
+        mask = _contains_mask(cache, node_ids)
+        result.update({id_: cache[id_] for id_ in node_ids[mask]})
+        misses = node_ids[~mask]
+        if misses.size:
+            result.update(self._cg.get_children(misses, raw_only=True))
+            update(cache, misses, [result[k] for k in misses])
         if flatten:
             return np.concatenate([*result.values()])
         return result
@@ -108,17 +113,11 @@ class CacheService:
         result = {}
         if not node_ids.size:
             return result
-        mask = np.in1d(
-            node_ids, np.fromiter(self.atomic_cx_edges_cache.keys(), dtype=NODE_ID)
-        )
-        cached_edges_ = self._atomic_cross_edges_vec(node_ids[mask])
-        result.update(
-            {id_: edges_ for id_, edges_ in zip(node_ids[mask], cached_edges_)}
-        )
-        result.update(self._cg.get_atomic_cross_edges(node_ids[~mask], raw_only=True))
-        update(
-            self.atomic_cx_edges_cache,
-            node_ids[~mask],
-            [result[k] for k in node_ids[~mask]],
-        )
+        cache = self.atomic_cx_edges_cache
+        mask = _contains_mask(cache, node_ids)
+        result.update({id_: cache[id_] for id_ in node_ids[mask]})
+        misses = node_ids[~mask]
+        if misses.size:
+            result.update(self._cg.get_atomic_cross_edges(misses, raw_only=True))
+            update(cache, misses, [result[k] for k in misses])
         return result
@@ -59,6 +59,8 @@ class ChunkedGraph:
         self._client = bt_client
         self._id_client = bt_client
         self._cache_service = None
+        self._segmentation_resolution = None
+        self._cross_edge_properties = None
         self.mock_edges = None  # hack for unit tests
 
     @property
@@ -87,7 +89,11 @@ class ChunkedGraph:
 
     @property
     def segmentation_resolution(self) -> np.ndarray:
-        return np.array(self.meta.ws_cv.scale["resolution"])
+        if self._segmentation_resolution is None:
+            self._segmentation_resolution = np.array(
+                self.meta.ws_cv.scale["resolution"]
+            )
+        return self._segmentation_resolution
 
     @cache.setter
     def cache(self, cache_service: CacheService):
@@ -139,7 +145,7 @@ class ChunkedGraph:
             return parent_id
         return id_helpers.get_atomic_id_from_coord(
             self.meta,
-            self.get_root,
+            self.get_roots,
             x,
             y,
             z,
@@ -196,6 +202,8 @@ class ChunkedGraph:
                 properties=attributes.Hierarchy.Parent,
                 end_time=time_stamp,
                 end_time_inclusive=True,
+                # only the newest parent within the range is used
+                latest_only=current,
             )
             if not parent_rows:
                 return types.empty_1d
@@ -240,6 +248,7 @@ class ChunkedGraph:
                 properties=attributes.Hierarchy.Parent,
                 end_time=time_stamp,
                 end_time_inclusive=True,
+                latest_only=latest,
             )
             if not parents:
                 return None
@@ -282,12 +291,12 @@ class ChunkedGraph:
             node_children_d = self.client.read_nodes(
                 node_ids=node_ids, properties=attributes.Hierarchy.Child
             )
-            return {
-                x: node_children_d[x][0].value
-                if x in node_children_d
-                else types.empty_1d.copy()
-                for x in node_ids
-            }
+            # single lookup per node instead of membership test + getitem
+            result = {}
+            for x in node_ids:
+                cells = node_children_d.get(x)
+                result[x] = cells[0].value if cells else types.empty_1d.copy()
+            return result
         return self.cache.children_multiple(node_ids)
 
     def get_atomic_cross_edges(
@@ -295,12 +304,16 @@ class ChunkedGraph:
     ) -> typing.Dict[np.uint64, typing.Dict[int, typing.Iterable]]:
         """Returns cross edges for level 2 IDs."""
         if raw_only or not self.cache:
-            node_edges_d_d = self.client.read_nodes(
-                node_ids=l2_ids,
-                properties=[
+            if self._cross_edge_properties is None:
+                self._cross_edge_properties = tuple(
                     attributes.Connectivity.CrossChunkEdge[l]
                     for l in range(2, max(3, self.meta.layer_count))
-                ],
+                )
+            node_edges_d_d = self.client.read_nodes(
+                node_ids=l2_ids,
+                properties=self._cross_edge_properties,
+                # only the latest version of each edge column is used
+                latest_only=True,
             )
             result = {}
             for id_ in l2_ids:
@@ -395,16 +408,17 @@ class ChunkedGraph:
         time_stamp = misc_utils.get_valid_timestamp(time_stamp)
         stop_layer = self.meta.layer_count if not stop_layer else stop_layer
         assert stop_layer <= self.meta.layer_count
-        layer_mask = np.ones(len(node_ids), dtype=bool)
+        node_ids = np.array(node_ids, dtype=basetypes.NODE_ID, copy=False)
+        chunk_layers = self.get_chunk_layers(node_ids)
+        # indices of ids still below stop_layer; keeping indices instead
+        # of a full-length boolean mask makes each iteration's gather and
+        # scatter proportional to the shrinking frontier, not the input
+        active_idx = np.flatnonzero((chunk_layers < stop_layer) & (node_ids != 0))
 
         for _ in range(n_tries):
-            chunk_layers = self.get_chunk_layers(node_ids)
-            layer_mask[chunk_layers >= stop_layer] = False
-            layer_mask[node_ids == 0] = False
-
             parent_ids = np.array(node_ids, dtype=basetypes.NODE_ID)
             for _ in range(int(stop_layer + 1)):
-                filtered_ids = parent_ids[layer_mask]
+                filtered_ids = parent_ids[active_idx]
                 unique_ids, inverse = np.unique(filtered_ids, return_inverse=True)
                 temp_ids = self.get_parents(
                     unique_ids, time_stamp=time_stamp, fail_to_zero=fail_to_zero
@@ -413,18 +427,17 @@ class ChunkedGraph:
                     break
                 else:
                     temp_ids_i = temp_ids[inverse]
-                    new_layer_mask = layer_mask.copy()
-                    new_layer_mask[new_layer_mask] = (
-                        self.get_chunk_layers(temp_ids_i) < stop_layer
-                    )
+                    # decode layers once per iteration; each additional
+                    # pass over a large batch costs a full array scan
+                    temp_layers = self.get_chunk_layers(temp_ids_i)
                     if not ceil:
-                        rev_m = self.get_chunk_layers(temp_ids_i) > stop_layer
+                        rev_m = temp_layers > stop_layer
                         temp_ids_i[rev_m] = filtered_ids[rev_m]
 
-                    parent_ids[layer_mask] = temp_ids_i
-                    layer_mask = new_layer_mask
+                    parent_ids[active_idx] = temp_ids_i
+                    active_idx = active_idx[temp_layers < stop_layer]
 
-                    if np.all(~layer_mask):
+                    if not active_idx.size:
                         if assert_roots:
                             assert not np.any(
                                 self.get_chunk_layers(parent_ids)
@@ -469,37 +482,42 @@ class ChunkedGraph:
         parent_id = node_id
         all_parent_ids = []
         stop_layer = self.meta.layer_count if not stop_layer else stop_layer
-        if self.get_chunk_layer(parent_id) == stop_layer:
+        node_layer = self.get_chunk_layer(node_id)
+        if node_layer == stop_layer:
             return (
                 np.array([node_id], dtype=basetypes.NODE_ID)
                 if get_all_parents
                 else node_id
             )
 
+        # track the layer alongside the id; decoding it from the id on
+        # every comparison repeats the same bit arithmetic several times
+        # per level of the climb
+        current_layer = node_layer
         for _ in range(n_tries):
             parent_id = node_id
-            for _ in range(self.get_chunk_layer(node_id), int(stop_layer + 1)):
+            current_layer = node_layer
+            for _ in range(node_layer, int(stop_layer + 1)):
                 temp_parent_id = self.get_parent(parent_id, time_stamp=time_stamp)
                 if temp_parent_id is None:
                     break
                 else:
                     parent_id = temp_parent_id
+                    current_layer = self.get_chunk_layer(parent_id)
 
-                    if self.get_chunk_layer(parent_id) >= stop_layer:
-                        if self.get_chunk_layer(parent_id) == stop_layer:
-                            all_parent_ids.append(parent_id)
-                        elif ceil:
+                    if current_layer >= stop_layer:
+                        if current_layer == stop_layer or ceil:
                             all_parent_ids.append(parent_id)
                         break
                     else:
                         all_parent_ids.append(parent_id)
 
-            if self.get_chunk_layer(parent_id) >= stop_layer:
+            if current_layer >= stop_layer:
                 break
             else:
                 time.sleep(0.5)
 
-        if self.get_chunk_layer(parent_id) < stop_layer:
+        if current_layer < stop_layer:
             raise exceptions.ChunkedGraphError(
                 f"Cannot find root id {node_id}, {stop_layer}, {time_stamp}"
             )
@@ -546,6 +564,54 @@ class ChunkedGraph:
         )
         return dict(zip(self.get_chunk_layers(parent_ids), parent_ids))
 
+    def get_all_parents_dicts(
+        self,
+        node_ids: typing.Iterable[np.uint64],
+        *,
+        time_stamp: typing.Optional[datetime.datetime] = None,
+    ) -> typing.Dict:
+        """
+        Batched version of get_all_parents_dict.
+        Walks all hierarchies together with one read per layer
+        instead of one read per node per layer.
+        Returns {node_id: {layer: parent_id}}.
+        """
+        time_stamp = misc_utils.get_valid_timestamp(time_stamp)
+        node_ids = np.array(node_ids, dtype=basetypes.NODE_ID)
+        root_layer = self.meta.layer_count
+        trajectories = {id_: [] for id_ in node_ids}
+        current_d = {id_: id_ for id_ in node_ids}
+
+        frontier = np.unique(node_ids)
+        frontier = frontier[self.get_chunk_layers(frontier) < root_layer]
+        for _ in range(int(root_layer + 1)):
+            if not frontier.size:
+                break
+            parents = self.get_parents(
+                frontier, time_stamp=time_stamp, fail_to_zero=True
+            )
+            parent_d = dict(zip(frontier, parents))
+            for id_, current in current_d.items():
+                parent = parent_d.get(current)
+                if parent is None:
+                    continue
+                if parent == 0:
+                    raise exceptions.ChunkedGraphError(
+                        f"Cannot find root id {id_}, {root_layer}, {time_stamp}"
+                    )
+                trajectories[id_].append(parent)
+                current_d[id_] = parent
+            frontier = np.unique(parents)
+            frontier = frontier[self.get_chunk_layers(frontier) < root_layer]
+
+        result = {}
+        for id_, trajectory in trajectories.items():
+            if not trajectory:
+                trajectory = [id_]
+            trajectory = np.array(trajectory, dtype=basetypes.NODE_ID)
+            result[id_] = dict(zip(self.get_chunk_layers(trajectory), trajectory))
+        return result
+
     def get_subgraph(
         self,
         node_id_or_ids: typing.Union[np.uint64, typing.Iterable],
@@ -657,7 +723,6 @@ class ChunkedGraph:
         Edges are read from cloud storage.
         """
         from itertools import chain
-        from functools import reduce
         from .misc import get_agglomerations
 
         chunk_ids = np.unique(self.get_chunk_ids_from_node_ids(level2_ids))
@@ -669,10 +734,10 @@ class ChunkedGraph:
             edges_d = self.read_chunk_edges(chunk_ids)
 
         fake_edges = self.get_fake_edges(chunk_ids)
-        all_chunk_edges = reduce(
-            lambda x, y: x + y,
-            chain(edges_d.values(), fake_edges.values()),
-            Edges([], []),
+        # single concatenation; pairwise Edges.__add__ copies all
+        # accumulated arrays once per chunk
+        all_chunk_edges = edge_utils.concatenate_edges(
+            chain(edges_d.values(), fake_edges.values())
         )
 
         if edges_only:
@@ -681,9 +746,10 @@ class ChunkedGraph:
             else:
                 all_chunk_edges = all_chunk_edges.get_pairs()
             supervoxels = self.get_children(level2_ids, flatten=True)
-            mask0 = np.in1d(all_chunk_edges[:, 0], supervoxels)
-            mask1 = np.in1d(all_chunk_edges[:, 1], supervoxels)
-            return all_chunk_edges[mask0 & mask1]
+            # one membership test over the (N, 2) pair array; per-column
+            # np.in1d calls sort the same arrays twice
+            mask = np.isin(all_chunk_edges, supervoxels)
+            return all_chunk_edges[mask.all(axis=1)]
 
         l2id_children_d = self.get_children(level2_ids)
         sv_parent_d = {}
@@ -942,6 +1008,9 @@ class ChunkedGraph:
     def get_segment_id(self, node_id: basetypes.NODE_ID):
         return id_helpers.get_segment_id(self.meta, node_id)
 
+    def get_segment_ids(self, node_ids: typing.Sequence):
+        return id_helpers.get_segment_ids(self.meta, node_ids)
+
     def get_segment_id_limit(self, node_or_chunk_id: basetypes.NODE_ID):
         return id_helpers.get_segment_id_limit(self.meta, node_or_chunk_id)
 
@@ -1,4 +1,3 @@
-from itertools import product
 from typing import Sequence
 from typing import Iterable
 
@@ -18,15 +17,12 @@ def get_children_chunk_coords(
     chunk_coords = np.array(chunk_coords, dtype=int)
     children_layer = layer - 1
     layer_boundaries = meta.layer_chunk_bounds[children_layer]
-    children_coords = []
+    fanout = meta.graph_config.FANOUT
 
-    for dcoord in product(*[range(meta.graph_config.FANOUT)] * 3):
-        dcoord = np.array(dcoord, dtype=int)
-        child_coords = chunk_coords * meta.graph_config.FANOUT + dcoord
-        check_bounds = np.less(child_coords, layer_boundaries)
-        if np.all(check_bounds):
-            children_coords.append(child_coords)
-    return np.array(children_coords)
+    offsets = np.stack(np.mgrid[:fanout, :fanout, :fanout], axis=-1).reshape(-1, 3)
+    children_coords = chunk_coords * fanout + offsets
+    mask = np.all(children_coords < layer_boundaries, axis=1)
+    return children_coords[mask]
 
 
 def get_children_chunk_ids(
@@ -42,12 +38,7 @@ def get_children_chunk_ids(
         return np.array([utils.get_chunk_id(meta, layer=layer, x=x, y=y, z=z)])
     else:
         children_coords = get_children_chunk_coords(meta, layer, (x, y, z))
-        children_chunk_ids = []
-        for (x, y, z) in children_coords:
-            children_chunk_ids.append(
-                utils.get_chunk_id(meta, layer=layer - 1, x=x, y=y, z=z)
-            )
-        return np.array(children_chunk_ids)
+        return utils.get_chunk_ids_from_coords(meta, layer - 1, children_coords)
 
 
 def get_parent_chunk_id(
@@ -56,8 +47,7 @@ def get_parent_chunk_id(
     """Parent chunk ID at given layer."""
     node_layer = utils.get_chunk_layer(meta, node_or_chunk_id)
     coord = utils.get_chunk_coordinates(meta, node_or_chunk_id)
-    for _ in range(node_layer, parent_layer):
-        coord = coord // meta.graph_config.FANOUT
+    coord = coord // meta.graph_config.FANOUT ** max(parent_layer - node_layer, 0)
     x, y, z = coord
     return utils.get_chunk_id(meta, layer=parent_layer, x=x, y=y, z=z)
 
@@ -66,16 +56,29 @@ def get_parent_chunk_ids(
     meta: ChunkedGraphMeta, node_or_chunk_id: np.uint64
 ) -> np.ndarray:
     """Creates list of chunk parent ids (upto highest layer)."""
-    parent_chunk_layers = range(
-        utils.get_chunk_layer(meta, node_or_chunk_id) + 1, meta.layer_count + 1
-    )
+    node_layer = utils.get_chunk_layer(meta, node_or_chunk_id)
+    layers = np.arange(node_layer + 1, meta.layer_count + 1, dtype=np.uint64)
     chunk_coord = utils.get_chunk_coordinates(meta, node_or_chunk_id)
-    parent_chunk_ids = [utils.get_chunk_id(meta, node_or_chunk_id)]
-    for layer in parent_chunk_layers:
-        chunk_coord = chunk_coord // meta.graph_config.FANOUT
-        x, y, z = chunk_coord
-        parent_chunk_ids.append(utils.get_chunk_id(meta, layer=layer, x=x, y=y, z=z))
-    return np.array(parent_chunk_ids, dtype=np.uint64)
+
+    # iterated floor division by the fanout is a single division by its powers
+    fanout_powers = meta.graph_config.FANOUT ** np.arange(1, len(layers) + 1)
+    coords = (chunk_coord[None, :] // fanout_powers[:, None]).astype(np.uint64)
+
+    bits_per_dim = meta.bits_per_dim_lut[layers]
+    layer_offset = np.uint64(64 - meta.graph_config.LAYER_ID_BITS)
+    x_offset = layer_offset - bits_per_dim
+    y_offset = x_offset - bits_per_dim
+    z_offset = y_offset - bits_per_dim
+
+    parent_chunk_ids = np.empty(len(layers) + 1, dtype=np.uint64)
+    parent_chunk_ids[0] = utils.get_chunk_id(meta, node_or_chunk_id)
+    parent_chunk_ids[1:] = (
+        layers << layer_offset
+        | coords[:, 0] << x_offset
+        | coords[:, 1] << y_offset
+        | coords[:, 2] << z_offset
+    )
+    return parent_chunk_ids
 
 
 def get_parent_chunk_id_dict(meta: ChunkedGraphMeta, node_or_chunk_id: np.uint64):
@@ -55,12 +55,8 @@ def get_chunk_layers(meta, node_or_chunk_ids: Sequence[np.uint64]) -> np.ndarray
     if len(node_or_chunk_ids) == 0:
         return np.array([], dtype=int)
 
-    layers = np.array(node_or_chunk_ids, dtype=int)
-
-    layers1 = layers >> (64 - meta.graph_config.LAYER_ID_BITS)
-    # layers2 = np.vectorize(get_chunk_layer)(meta, node_or_chunk_ids)
-    # assert np.all(layers1 == layers2)
-    return layers1
+    ids = np.asarray(node_or_chunk_ids, dtype=np.uint64)
+    return (ids >> np.uint64(64 - meta.graph_config.LAYER_ID_BITS)).astype(int)
 
 
 def get_chunk_coordinates(meta, node_or_chunk_id: np.uint64) -> np.ndarray:
@@ -68,38 +64,42 @@ def get_chunk_coordinates(meta, node_or_chunk_id: np.uint64) -> np.ndarray:
     :param node_or_chunk_id: np.uint64
     :return: Tuple(int, int, int)
     """
-    layer = get_chunk_layer(meta, node_or_chunk_id)
+    id_int = int(node_or_chunk_id)
+    layer = id_int >> 64 - meta.graph_config.LAYER_ID_BITS
     bits_per_dim = meta.bitmasks[layer]
 
     x_offset = 64 - meta.graph_config.LAYER_ID_BITS - bits_per_dim
     y_offset = x_offset - bits_per_dim
     z_offset = y_offset - bits_per_dim
 
-    x = int(node_or_chunk_id) >> x_offset & 2 ** bits_per_dim - 1
-    y = int(node_or_chunk_id) >> y_offset & 2 ** bits_per_dim - 1
-    z = int(node_or_chunk_id) >> z_offset & 2 ** bits_per_dim - 1
+    mask = (1 << bits_per_dim) - 1
+    x = id_int >> x_offset & mask
+    y = id_int >> y_offset & mask
+    z = id_int >> z_offset & mask
     return np.array([x, y, z])
 
 
 def get_chunk_coordinates_multiple(meta, ids: np.ndarray) -> np.ndarray:
     """
-    Array version of get_chunk_coordinates.
-    Assumes all given IDs are in same layer.
+    Array version of get_chunk_coordinates; handles IDs from mixed layers.
+    :param ids: np.ndarray
+    :return: np.ndarray with shape (len(ids), 3)
     """
     if not len(ids):
         return np.array([])
-    layer = get_chunk_layer(meta, ids[0])
-    bits_per_dim = meta.bitmasks[layer]
+    ids = np.asarray(ids, dtype=np.uint64)
+    layers = get_chunk_layers(meta, ids)
 
-    x_offset = 64 - meta.graph_config.LAYER_ID_BITS - bits_per_dim
+    bits_per_dim = meta.bits_per_dim_lut[layers]
+    x_offset = np.uint64(64 - meta.graph_config.LAYER_ID_BITS) - bits_per_dim
     y_offset = x_offset - bits_per_dim
     z_offset = y_offset - bits_per_dim
+    mask = (np.uint64(1) << bits_per_dim) - np.uint64(1)
 
-    ids = np.array(ids, dtype=int)
-    X = ids >> x_offset & 2 ** bits_per_dim - 1
-    Y = ids >> y_offset & 2 ** bits_per_dim - 1
-    Z = ids >> z_offset & 2 ** bits_per_dim - 1
-    return np.column_stack((X, Y, Z))
+    X = ids >> x_offset & mask
+    Y = ids >> y_offset & mask
+    Z = ids >> z_offset & mask
+    return np.column_stack((X, Y, Z)).astype(int)
 
 
 def get_chunk_id(
@@ -116,10 +116,7 @@ def get_chunk_id(
     assert node_id is not None or all(v is not None for v in [layer, x, y, z])
     if node_id is not None:
         layer = get_chunk_layer(meta, node_id)
-    bits_per_dim = meta.bitmasks[layer]
-
-    if node_id is not None:
-        chunk_offset = 64 - meta.graph_config.LAYER_ID_BITS - 3 * bits_per_dim
+        chunk_offset = int(meta.chunk_offset_lut[layer])
         return np.uint64((int(node_id) >> chunk_offset) << chunk_offset)
     return _compute_chunk_id(meta, layer, x, y, z)
 
@@ -146,13 +143,9 @@ def get_chunk_ids_from_node_ids(meta, ids: Iterable[np.uint64]) -> np.ndarray:
     if len(ids) == 0:
         return np.array([], dtype=np.uint64)
 
-    bits_per_dims = np.array([meta.bitmasks[l] for l in get_chunk_layers(meta, ids)])
-    offsets = 64 - meta.graph_config.LAYER_ID_BITS - 3 * bits_per_dims
-
-    cids1 = np.array((np.array(ids, dtype=int) >> offsets) << offsets, dtype=np.uint64)
-    # cids2 = np.vectorize(get_chunk_id)(meta, ids)
-    # assert np.all(cids1 == cids2)
-    return cids1
+    ids = np.asarray(ids, dtype=np.uint64)
+    offsets = meta.chunk_offset_lut[get_chunk_layers(meta, ids)]
+    return (ids >> offsets) << offsets
 
 
 def _compute_chunk_id(
@@ -194,18 +187,18 @@ def _get_chunk_coordinates_from_vol_coordinates(
     scaling = np.array(meta.resolution / resolution, dtype=int)
 
     chunk_size = meta.graph_config.CHUNK_SIZE
-    x = (x / scaling[0] - meta.voxel_bounds[0, 0]) / chunk_size[0]
-    y = (y / scaling[1] - meta.voxel_bounds[1, 0]) / chunk_size[1]
-    z = (z / scaling[2] - meta.voxel_bounds[2, 0]) / chunk_size[2]
-
-    x /= meta.graph_config.FANOUT ** (max(layer - 2, 0))
-    y /= meta.graph_config.FANOUT ** (max(layer - 2, 0))
-    z /= meta.graph_config.FANOUT ** (max(layer - 2, 0))
-
-    coords = np.array([x, y, z])
-    if ceil:
-        coords = np.ceil(coords)
-    return coords.astype(int)
+    fanout_factor = meta.graph_config.FANOUT ** max(layer - 2, 0)
+
+    coords = []
+    for val, scale, offset, size in zip(
+        (x, y, z), scaling, meta.voxel_bounds[:, 0], chunk_size
+    ):
+        # (val / scale - offset) / (size * fanout) as a single exact
+        # integer division; floats can misround at chunk boundaries
+        num = int(val) - int(offset) * int(scale)
+        denom = int(scale) * int(size) * fanout_factor
+        coords.append(-(-num // denom) if ceil else num // denom)
+    return np.array(coords)
 
 
 def get_bounding_children_chunks(
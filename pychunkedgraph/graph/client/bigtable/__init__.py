@@ -10,7 +10,8 @@ _bigtableconfig_fields = (
     "ADMIN",
     "READ_ONLY",
     "CREDENTIALS",
-    "MAX_ROW_KEY_COUNT"
+    "MAX_ROW_KEY_COUNT",
+    "POOL_SIZE",  # number of grpc channels for concurrent rpcs
 )
 _bigtableconfig_defaults = (
     environ.get("BIGTABLE_PROJECT", DEFAULT_PROJECT),
@@ -18,7 +19,8 @@ _bigtableconfig_defaults = (
     False,
     True,
     None,
-    1000
+    1000,
+    int(environ.get("BIGTABLE_POOL_SIZE", 10)),
 )
 BigTableConfig = namedtuple(
     "BigTableConfig", _bigtableconfig_fields, defaults=_bigtableconfig_defaults
@@ -5,7 +5,9 @@ import time
 import typing
 import logging
 import datetime
+import threading
 from datetime import datetime
+from itertools import cycle
 
 import numpy as np
 from multiwrapper import multiprocessing_utils as mu
@@ -32,9 +34,25 @@ from ...utils.serializers import pad_node_id
 from ...utils.serializers import serialize_key
 from ...utils.serializers import serialize_uint64
 from ...utils.serializers import deserialize_uint64
+from ...utils.serializers import serialize_uint64s
+from ...utils.serializers import deserialize_uint64s
 from ...meta import ChunkedGraphMeta
 from ...utils.generic import get_valid_timestamp
 
+# reads are IO bound and the gRPC layer releases the GIL, so read
+# concurrency is not tied to CPU count; bounded to keep request
+# fan-out and thread overhead in check
+_MAX_READ_THREADS = 64
+
+# Bigtable rejects read requests whose serialized size exceeds 512 KiB;
+# stay well below that when packing row keys into a single subrequest
+_MAX_READ_REQUEST_BYTES = 400 * 1024
+
+# graph version and meta are immutable once written;
+# cache them per process so long-running servers that create
+# a client per request read them only once per table
+_settings_cache: typing.Dict[typing.Tuple[str, str, str], typing.Dict] = {}
+
 
 class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
     def __init__(
@@ -59,6 +77,20 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         self._instance = self.instance(config.INSTANCE)
         self._table = self._instance.table(table_id)
 
+        # Additional clients, each with its own grpc channel.
+        # A single channel is limited to ~100 concurrent streams;
+        # requests beyond that queue client side, capping read throughput.
+        self._table_pool = [self._table]
+        for _ in range(max(config.POOL_SIZE, 1) - 1):
+            pool_client = bigtable.Client(
+                project=config.PROJECT,
+                read_only=config.READ_ONLY,
+                admin=config.ADMIN,
+                credentials=self._credentials,
+            )
+            self._table_pool.append(pool_client.instance(config.INSTANCE).table(table_id))
+        self._table_cycle = cycle(self._table_pool)
+
         self.logger = logging.getLogger(
             f"{config.PROJECT}/{config.INSTANCE}/{table_id}"
         )
@@ -69,6 +101,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
             self.logger.addHandler(sh)
         self._graph_meta = graph_meta
         self._version = None
+        self._settings_key = (config.PROJECT, config.INSTANCE, table_id)
         self._max_row_key_count = config.MAX_ROW_KEY_COUNT
 
     @property
@@ -87,6 +120,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
     def add_graph_version(self, version: str):
         assert self.read_graph_version() is None, "Graph has already been versioned."
         self._version = version
+        _settings_cache.setdefault(self._settings_key, {})["version"] = version
         row = self.mutate_row(
             attributes.GraphVersion.key,
             {attributes.GraphVersion.Version: version},
@@ -94,9 +128,19 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         self.write([row])
 
     def read_graph_version(self) -> str:
+        if self._version is not None:
+            # immutable once written; skip the round-trip
+            return self._version
+        cached = _settings_cache.get(self._settings_key, {})
+        if "version" in cached:
+            self._version = cached["version"]
+            return self._version
         try:
             row = self._read_byte_row(attributes.GraphVersion.key)
             self._version = row[attributes.GraphVersion.Version][0].value
+            _settings_cache.setdefault(self._settings_key, {})[
+                "version"
+            ] = self._version
             return self._version
         except KeyError:
             return None
@@ -114,6 +158,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         if overwrite:
             self._delete_meta()
         self._graph_meta = meta
+        _settings_cache.setdefault(self._settings_key, {})["meta"] = meta
         row = self.mutate_row(
             attributes.GraphMeta.key,
             {attributes.GraphMeta.Meta: meta},
@@ -121,8 +166,16 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         self.write([row])
 
     def read_graph_meta(self) -> ChunkedGraphMeta:
-        row = self._read_byte_row(attributes.GraphMeta.key)
-        self._graph_meta = row[attributes.GraphMeta.Meta][0].value
+        if self._graph_meta is None:
+            cached = _settings_cache.get(self._settings_key, {})
+            if "meta" in cached:
+                self._graph_meta = cached["meta"]
+                return self._graph_meta
+            row = self._read_byte_row(attributes.GraphMeta.key)
+            self._graph_meta = row[attributes.GraphMeta.Meta][0].value
+            _settings_cache.setdefault(self._settings_key, {})[
+                "meta"
+            ] = self._graph_meta
         return self._graph_meta
 
     def read_nodes(
@@ -137,10 +190,13 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         end_time=None,
         end_time_inclusive: bool = False,
         fake_edges: bool = False,
+        latest_only: bool = False,
     ):
         """
         Read nodes and their properties.
         Accepts a range of node IDs or specific node IDs.
+        `latest_only` limits the response to the most recent cell per column,
+        skipping older versions server-side.
         """
         if node_ids is not None and len(node_ids) > self._max_row_key_count:
             # bigtable reading is faster
@@ -154,9 +210,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
             if end_id is not None
             else None,
             end_key_inclusive=end_id_inclusive,
-            row_keys=(
-                serialize_uint64(node_id, fake_edges=fake_edges) for node_id in node_ids
-            )
+            row_keys=serialize_uint64s(node_ids, fake_edges=fake_edges)
             if node_ids is not None
             else None,
             columns=properties,
@@ -164,11 +218,14 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
             end_time=end_time,
             end_time_inclusive=end_time_inclusive,
             user_id=user_id,
+            latest_only=latest_only,
         )
-        return {
-            deserialize_uint64(row_key, fake_edges=fake_edges): data
-            for (row_key, data) in rows.items()
-        }
+        if not rows:
+            return {}
+        # one vectorized pass over the returned keys instead of
+        # a python parse per row
+        node_ids = deserialize_uint64s(rows.keys(), fake_edges=fake_edges)
+        return dict(zip(node_ids, rows.values()))
 
     def read_node(
         self,
@@ -180,6 +237,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         end_time: typing.Optional[datetime] = None,
         end_time_inclusive: bool = False,
         fake_edges: bool = False,
+        latest_only: bool = False,
     ) -> typing.Union[
         typing.Dict[attributes._Attribute, typing.List[bigtable.row_data.Cell]],
         typing.List[bigtable.row_data.Cell],
@@ -213,6 +271,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
             start_time=start_time,
             end_time=end_time,
             end_time_inclusive=end_time_inclusive,
+            latest_only=latest_only,
         )
 
     def write_nodes(self, nodes, root_ids=None, operation_id=None):
@@ -225,7 +284,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         self, operation_id: np.uint64
     ) -> typing.Tuple[typing.Dict, datetime]:
         log_record = self.read_node(
-            operation_id, properties=attributes.OperationLogs.all()
+            operation_id, properties=attributes.OperationLogs.all(), latest_only=True
         )
         if len(log_record) == 0:
             return {}, None
@@ -258,6 +317,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
                 start_time=start_time,
                 end_time=end_time,
                 end_time_inclusive=end_time_inclusive,
+                latest_only=True,
             )
         else:
             logs_d = self.read_nodes(
@@ -267,6 +327,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
                 end_time=end_time,
                 end_time_inclusive=end_time_inclusive,
                 user_id=user_id,
+                latest_only=True,
             )
         if not logs_d:
             return {}
@@ -330,12 +391,30 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
                     f"Root lock renewal failed: operation {operation_id}"
                 )
 
-        for i in range(0, len(rows), block_size):
-            status = self._table.mutate_rows(rows[i : i + block_size], retry=retry)
+        blocks = [rows[i : i + block_size] for i in range(0, len(rows), block_size)]
+        if len(blocks) == 1:
+            status = self._table.mutate_rows(blocks[0], retry=retry)
             if not all(status):
                 raise exceptions.ChunkedGraphError(
                     f"Bulk write failed: operation {operation_id}"
                 )
+            return
+        # blocks are independent mutations; submit them concurrently
+        # instead of serializing the rpcs
+        statuses = mu.multithread_func(
+            self._mutate_rows_thread,
+            params=[(next(self._table_cycle), block, retry) for block in blocks],
+            debug=len(blocks) == 1,
+            n_threads=min(len(blocks), 2 * mu.n_cpus),
+        )
+        if not all(statuses):
+            raise exceptions.ChunkedGraphError(
+                f"Bulk write failed: operation {operation_id}"
+            )
+
+    def _mutate_rows_thread(self, args) -> bool:
+        table, block, retry = args
+        return all(table.mutate_rows(block, retry=retry))
 
     def mutate_row(
         self,
@@ -382,7 +461,9 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
 
         # The lock was acquired when set_cell returns False (state)
         lock_acquired = not root_row.commit()
-        if not lock_acquired:
+        # the extra read on failure is purely informational;
+        # skip the round trip unless debug logging is on
+        if not lock_acquired and self.logger.isEnabledFor(logging.DEBUG):
             row = self._read_byte_row(serialize_uint64(root_id), columns=lock_column)
             l_operation_ids = [cell.value for cell in row]
             self.logger.debug(f"Locked operation ids: {l_operation_ids}")
@@ -410,7 +491,9 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
 
         # The lock was acquired when set_cell returns False (state)
         lock_acquired = not root_row.commit()
-        if not lock_acquired:
+        # the extra read on failure is purely informational;
+        # skip the round trip unless debug logging is on
+        if not lock_acquired and self.logger.isEnabledFor(logging.DEBUG):
             row = self._read_byte_row(serialize_uint64(root_id), columns=lock_column)
             l_operation_ids = [cell.value for cell in row]
             self.logger.debug(f"Indefinitely locked operation ids: {l_operation_ids}")
@@ -532,11 +615,30 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
 
     def renew_locks(self, root_ids: np.uint64, operation_id: np.uint64) -> bool:
         """Renews existing root node locks with operation_id to extend time."""
-        for root_id in root_ids:
-            if not self.renew_lock(root_id, operation_id):
+        # conditional writes cannot be batched into a single mutation, but
+        # the per-root renewals are independent (all locks are held by the
+        # same operation), so issue them concurrently instead of serially
+        if len(root_ids) > 1:
+            results = mu.multithread_func(
+                self._renew_lock_thread,
+                params=[(root_id, operation_id) for root_id in root_ids],
+                n_threads=min(len(root_ids), _MAX_READ_THREADS),
+            )
+        else:
+            results = [
+                (root_id, self.renew_lock(root_id, operation_id))
+                for root_id in root_ids
+            ]
+        renewed = True
+        for root_id, success in results:
+            if not success:
                 self.logger.warning(f"renew_lock failed - {root_id}")
-                return False
-        return True
+                renewed = False
+        return renewed
+
+    def _renew_lock_thread(self, args) -> typing.Tuple[np.uint64, bool]:
+        root_id, operation_id = args
+        return root_id, self.renew_lock(root_id, operation_id)
 
     def get_lock_timestamp(
         self, root_id: np.uint64, operation_id: np.uint64
@@ -557,15 +659,23 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         operation_ids: typing.Sequence[np.uint64],
     ) -> typing.Union[datetime, None]:
         """Minimum of multiple lock timestamps."""
+        # one batched read for all locks instead of one per root
+        rows = self.read_nodes(
+            node_ids=root_ids, properties=attributes.Concurrency.Lock
+        )
         time_stamps = []
         for root_id, operation_id in zip(root_ids, operation_ids):
-            time_stamp = self.get_lock_timestamp(root_id, operation_id)
-            if time_stamp is None:
+            cells = rows.get(root_id)
+            if not cells:
+                self.logger.warning(f"No lock found for {root_id}")
+                return None
+            if cells[0].value != operation_id:
+                self.logger.warning(f"{root_id} not locked with {operation_id}")
                 return None
-            time_stamps.append(time_stamp)
+            time_stamps.append(cells[0].timestamp)
         if len(time_stamps) == 0:
             return None
-        return np.min(time_stamps)
+        return min(time_stamps)
 
     # IDs
     def create_node_ids(
@@ -588,18 +698,53 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         """Generate a unique node ID in the chunk."""
         return self.create_node_ids(chunk_id, 1, root_chunk=root_chunk)[0]
 
+    def _create_node_id_thread(self, args) -> basetypes.NODE_ID:
+        chunk_id, root_chunk = args
+        return self.create_node_ids(chunk_id, 1, root_chunk=root_chunk)[0]
+
+    def create_node_ids_multiple(
+        self,
+        chunk_ids: typing.Sequence[np.uint64],
+        root_chunk_mask: typing.Optional[typing.Sequence[bool]] = None,
+    ) -> np.ndarray:
+        """
+        Generates one unique node ID in each of the given chunks.
+        The counter increments are synchronous round-trips, so they are
+        issued concurrently; latency is bounded by the slowest one
+        instead of their sum.
+        """
+        if root_chunk_mask is None:
+            root_chunk_mask = [False] * len(chunk_ids)
+        params = list(zip(chunk_ids, root_chunk_mask))
+        if not params:
+            return np.array([], dtype=basetypes.NODE_ID)
+        n_threads = min(len(params), 2 * mu.n_cpus)
+        new_ids = mu.multithread_func(
+            self._create_node_id_thread,
+            params=params,
+            debug=n_threads == 1,
+            n_threads=n_threads,
+        )
+        return np.array(new_ids, dtype=basetypes.NODE_ID)
+
     def get_max_node_id(
         self, chunk_id: basetypes.CHUNK_ID, root_chunk=False
     ) -> basetypes.NODE_ID:
         """Gets the current maximum segment ID in the chunk."""
         if root_chunk:
             n_counters = np.uint64(2**8)
+            # single batched read for all counter rows instead of
+            # one round-trip per counter
+            row_keys = [
+                serialize_key(f"i{pad_node_id(chunk_id)}_{counter}")
+                for counter in range(n_counters)
+            ]
+            rows = self._read_byte_rows(
+                row_keys=row_keys, columns=attributes.Concurrency.Counter
+            )
             max_value = 0
-            for counter in range(n_counters):
-                row = self._read_byte_row(
-                    serialize_key(f"i{pad_node_id(chunk_id)}_{counter}"),
-                    columns=attributes.Concurrency.Counter,
-                )
+            for counter, row_key in enumerate(row_keys):
+                row = rows.get(row_key, [])
                 val = (
                     basetypes.SEGMENT_ID.type(row[0].value if row else 0) * n_counters
                     + counter
@@ -679,6 +824,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         end_time: typing.Optional[datetime] = None,
         end_time_inclusive: bool = False,
         user_id: typing.Optional[str] = None,
+        latest_only: bool = False,
     ) -> typing.Dict[
         bytes,
         typing.Union[
@@ -725,14 +871,24 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         # Create filters: Rows
         row_set = RowSet()
         if row_keys is not None:
-            row_set.row_keys = list(row_keys)
+            # assign the key list directly instead of add_row_key() calls;
+            # callers like read_nodes already pass a fresh list
+            row_set.row_keys = (
+                row_keys if isinstance(row_keys, list) else list(row_keys)
+            )
         elif start_key is not None and end_key is not None:
-            row_set.add_row_range_from_keys(
-                start_key=start_key,
-                start_inclusive=True,
-                end_key=end_key,
-                end_inclusive=end_key_inclusive,
+            # partition large id ranges so _read can issue bounded
+            # concurrent subrequests instead of one monolithic scan
+            sub_ranges = self._partition_key_range(
+                start_key, end_key, end_key_inclusive
             )
+            for sub_start, sub_end, sub_end_inclusive in sub_ranges:
+                row_set.add_row_range_from_keys(
+                    start_key=sub_start,
+                    start_inclusive=True,
+                    end_key=sub_end,
+                    end_inclusive=sub_end_inclusive,
+                )
         else:
             raise exceptions.PreconditionError(
                 "Need to either provide a valid set of rows, or"
@@ -744,18 +900,26 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
             end_time=end_time,
             end_inclusive=end_time_inclusive,
             user_id=user_id,
+            latest_only=latest_only,
         )
         # Bigtable read with retries
         rows = self._read(row_set=row_set, row_filter=filter_)
 
         # Deserialize cells
-        for row_key, column_dict in rows.items():
+        # resolve each column's deserializer once; the per-cell loop
+        # dominates post-IO time on large reads
+        deserializers = {}
+        for column_dict in rows.values():
             for column, cell_entries in column_dict.items():
+                deserialize = deserializers.get(column)
+                if deserialize is None:
+                    deserialize = deserializers[column] = column.deserialize
                 for cell_entry in cell_entries:
-                    cell_entry.value = column.deserialize(cell_entry.value)
-            # If no column array was requested, reattach single column's values directly to the row
-            if isinstance(columns, attributes._Attribute):
-                rows[row_key] = cell_entries
+                    cell_entry.value = deserialize(cell_entry.value)
+        # If no column array was requested, reattach single column's values directly to the row
+        if isinstance(columns, attributes._Attribute):
+            for row_key, column_dict in rows.items():
+                rows[row_key] = next(iter(column_dict.values()), [])
         return rows
 
     def _read_byte_row(
@@ -767,6 +931,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         start_time: typing.Optional[datetime] = None,
         end_time: typing.Optional[datetime] = None,
         end_time_inclusive: bool = False,
+        latest_only: bool = False,
     ) -> typing.Union[
         typing.Dict[attributes._Attribute, typing.List[bigtable.row_data.Cell]],
         typing.List[bigtable.row_data.Cell],
@@ -803,22 +968,67 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
             start_time=start_time,
             end_time=end_time,
             end_time_inclusive=end_time_inclusive,
+            latest_only=latest_only,
         )
-        return (
-            row.get(row_key, [])
-            if isinstance(columns, attributes._Attribute)
-            else row.get(row_key, {})
+        # `row` holds at most the single requested entry;
+        # skip rehashing the key to pull it out
+        return next(
+            iter(row.values()),
+            [] if isinstance(columns, attributes._Attribute) else {},
         )
 
-    def _execute_read_thread(self, args: typing.Tuple[Table, RowSet, RowFilter]):
-        table, row_set, row_filter = args
+    def _partition_key_range(
+        self, start_key: bytes, end_key: bytes, end_key_inclusive: bool
+    ) -> typing.List[typing.Tuple[bytes, bytes, bool]]:
+        """Splits a serialized uint64 key range into bounded sub-ranges.
+
+        Row keys are zero padded decimal ids, so lexicographic order matches
+        numeric order and the range can be split numerically. Returns the
+        range unsplit if the keys are not numeric or the range is small.
+        """
+        try:
+            prefix = b""
+            start_bytes, end_bytes = start_key, end_key
+            if start_bytes[:1] == b"f" and end_bytes[:1] == b"f":
+                prefix = b"f"
+                start_bytes, end_bytes = start_bytes[1:], end_bytes[1:]
+            start, end = int(start_bytes), int(end_bytes)
+            width = len(start_bytes)
+        except ValueError:
+            return [(start_key, end_key, end_key_inclusive)]
+
+        n_parts = min(
+            int(np.ceil((end - start) / self._max_row_key_count)), _MAX_READ_THREADS
+        )
+        if n_parts <= 1:
+            return [(start_key, end_key, end_key_inclusive)]
+
+        step = (end - start) // n_parts
+        boundaries = [
+            prefix + str(start + i * step).zfill(width).encode() for i in range(n_parts)
+        ]
+        boundaries[0] = start_key
+        boundaries.append(end_key)
+        sub_ranges = [
+            (boundaries[i], boundaries[i + 1], False) for i in range(n_parts - 1)
+        ]
+        sub_ranges.append((boundaries[-2], end_key, end_key_inclusive))
+        return sub_ranges
+
+    def _execute_read_thread(
+        self, args: typing.Tuple[Table, RowSet, RowFilter, typing.Dict, threading.Lock]
+    ):
+        table, row_set, row_filter, result, lock = args
         if not row_set.row_keys and not row_set.row_ranges:
             # Check for everything falsy, because Bigtable considers even empty
             # lists of row_keys as no upper/lower bound!
-            return {}
-        range_read = table.read_rows(row_set=row_set, filter_=row_filter)
-        res = {v.row_key: utils.partial_row_data_to_column_dict(v) for v in range_read}
-        return res
+            return
+        # consume rows as they stream in; buffering each subrequest and
+        # merging afterwards doubles peak memory on large chunk scans
+        for row in table.read_rows(row_set=row_set, filter_=row_filter):
+            column_dict = utils.partial_row_data_to_column_dict(row)
+            with lock:
+                result[row.row_key] = column_dict
 
     def _read(
         self, row_set: RowSet, row_filter: RowFilter = None
@@ -828,33 +1038,47 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         :param row_filter: BigTable RowFilter
         :return: typing.Dict[bytes, typing.Dict[attributes._Attribute, bigtable.row_data.PartialRowData]]
         """
-        # FIXME: Bigtable limits the length of the serialized request to 512 KiB. We should
-        # calculate this properly (range_read.request.SerializeToString()), but this estimate is
-        # good enough for now
+        n_keys = len(row_set.row_keys)
+        keys_per_subrequest = self._max_row_key_count
+        if n_keys > keys_per_subrequest * _MAX_READ_THREADS:
+            # more subrequests than threads would queue extra RPCs per thread;
+            # grow the subrequests instead, bounded by the request byte budget
+            # (each key costs its length plus a few bytes of proto framing,
+            # the filter is serialized once per request)
+            budget = _MAX_READ_REQUEST_BYTES
+            if row_filter is not None:
+                budget -= len(row_filter.to_pb().SerializeToString())
+            key_cost = len(row_set.row_keys[0]) + 3
+            keys_per_subrequest = max(
+                keys_per_subrequest,
+                min(budget // key_cost, -(-n_keys // _MAX_READ_THREADS)),
+            )
 
-        n_subrequests = max(
-            1, int(np.ceil(len(row_set.row_keys) / self._max_row_key_count))
-        )
-        n_threads = min(n_subrequests, 2 * mu.n_cpus)
+        n_key_subrequests = int(np.ceil(n_keys / keys_per_subrequest))
+        n_subrequests = max(1, n_key_subrequests, len(row_set.row_ranges))
+        n_threads = min(n_subrequests, _MAX_READ_THREADS)
 
         row_sets = []
         for i in range(n_subrequests):
             r = RowSet()
             r.row_keys = row_set.row_keys[
-                i * self._max_row_key_count : (i + 1) * self._max_row_key_count
+                i * keys_per_subrequest : (i + 1) * keys_per_subrequest
             ]
             row_sets.append(r)
 
-        # Don't forget the original RowSet's row_ranges
-        row_sets[0].row_ranges = row_set.row_ranges
-        responses = mu.multithread_func(
+        # Don't forget the original RowSet's row_ranges;
+        # distribute them so each subrequest scans a bounded range
+        for i, row_range in enumerate(row_set.row_ranges):
+            row_sets[i % n_subrequests].row_ranges.append(row_range)
+        combined_response = {}
+        lock = threading.Lock()
+        mu.multithread_func(
             self._execute_read_thread,
-            params=((self._table, r, row_filter) for r in row_sets),
+            params=(
+                (next(self._table_cycle), r, row_filter, combined_response, lock)
+                for r in row_sets
+            ),
             debug=n_threads == 1,
             n_threads=n_threads,
         )
-
-        combined_response = {}
-        for resp in responses:
-            combined_response.update(resp)
         return combined_response
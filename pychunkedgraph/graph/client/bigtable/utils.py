@@ -15,6 +15,7 @@ from google.cloud.bigtable.row_filters import RowFilterChain
 from google.cloud.bigtable.row_filters import RowFilterUnion
 from google.cloud.bigtable.row_filters import ValueRangeFilter
 from google.cloud.bigtable.row_filters import CellsRowLimitFilter
+from google.cloud.bigtable.row_filters import CellsColumnLimitFilter
 from google.cloud.bigtable.row_filters import ColumnRangeFilter
 from google.cloud.bigtable.row_filters import TimestampRangeFilter
 from google.cloud.bigtable.row_filters import ConditionalRowFilter
@@ -26,10 +27,16 @@ from ... import attributes
 def partial_row_data_to_column_dict(
     partial_row_data: PartialRowData,
 ) -> Dict[attributes._Attribute, PartialRowData]:
+    # called once per row on reads; resolve attributes with a direct
+    # registry lookup instead of a from_key() call per column
+    registry = attributes._Attribute._attributes
     new_column_dict = {}
     for family_id, column_dict in partial_row_data._cells.items():
         for column_key, column_values in column_dict.items():
-            column = attributes.from_key(family_id, column_key)
+            column = registry.get((family_id, column_key))
+            if column is None:
+                # fall back for the KeyError with a readable message
+                column = attributes.from_key(family_id, column_key)
             new_column_dict[column] = column_values
     return new_column_dict
 
@@ -123,6 +130,7 @@ def get_time_range_and_column_filter(
     end_time: Optional[datetime] = None,
     end_inclusive: bool = False,
     user_id: Optional[str] = None,
+    latest_only: bool = False,
 ) -> RowFilter:
     time_filter = _get_time_range_filter(
         start_time=start_time, end_time=end_time, end_inclusive=end_inclusive
@@ -138,11 +146,33 @@ def get_time_range_and_column_filter(
     if user_id is not None:
         user_filter = _get_user_filter(user_id=user_id)
         filters.append(user_filter)
+    if latest_only:
+        # applied after the time filter, so this returns the most
+        # recent cell per column within the requested time range
+        filters.append(CellsColumnLimitFilter(1))
     if len(filters) > 1:
         return RowFilterChain(filters)
     return filters[0]
 
 
+# exact-key column filters are invariant; lock paths rebuild them for
+# every attempt of every root, so they are cached per column
+_column_key_filters = {}
+
+
+def _get_column_key_filter(column: attributes._Attribute) -> ColumnRangeFilter:
+    filter_ = _column_key_filters.get(column.key)
+    if filter_ is None:
+        filter_ = _column_key_filters[column.key] = ColumnRangeFilter(
+            column_family_id=column.family_id,
+            start_column=column.key,
+            end_column=column.key,
+            inclusive_start=True,
+            inclusive_end=True,
+        )
+    return filter_
+
+
 def get_root_lock_filter(
     lock_column, lock_expiry, indefinite_lock_column
 ) -> ConditionalRowFilter:
@@ -155,30 +185,9 @@ def get_root_lock_filter(
     # exists) and if it is still valid (timestamp younger than
     # LOCK_EXPIRED_TIME_DELTA) and if there is no new parent (== new_parents
     # exists)
-    lock_key_filter = ColumnRangeFilter(
-        column_family_id=lock_column.family_id,
-        start_column=lock_column.key,
-        end_column=lock_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
-
-    indefinite_lock_key_filter = ColumnRangeFilter(
-        column_family_id=indefinite_lock_column.family_id,
-        start_column=indefinite_lock_column.key,
-        end_column=indefinite_lock_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
-
-    new_parents_column = attributes.Hierarchy.NewParent
-    new_parents_key_filter = ColumnRangeFilter(
-        column_family_id=new_parents_column.family_id,
-        start_column=new_parents_column.key,
-        end_column=new_parents_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
+    lock_key_filter = _get_column_key_filter(lock_column)
+    indefinite_lock_key_filter = _get_column_key_filter(indefinite_lock_column)
+    new_parents_key_filter = _get_column_key_filter(attributes.Hierarchy.NewParent)
 
     temporal_lock_filter = RowFilterChain([time_filter, lock_key_filter])
     return ConditionalRowFilter(
@@ -188,35 +197,24 @@ def get_root_lock_filter(
     )
 
 
-def get_indefinite_root_lock_filter(lock_column) -> ConditionalRowFilter:
-    lock_key_filter = ColumnRangeFilter(
-        column_family_id=lock_column.family_id,
-        start_column=lock_column.key,
-        end_column=lock_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
+_indefinite_root_lock_filters = {}
 
-    new_parents_column = attributes.Hierarchy.NewParent
-    new_parents_key_filter = ColumnRangeFilter(
-        column_family_id=new_parents_column.family_id,
-        start_column=new_parents_column.key,
-        end_column=new_parents_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
 
-    return ConditionalRowFilter(
-        base_filter=lock_key_filter,
-        true_filter=PassAllFilter(True),
-        false_filter=new_parents_key_filter,
-    )
+def get_indefinite_root_lock_filter(lock_column) -> ConditionalRowFilter:
+    # no time component, so the whole conditional filter is invariant
+    filter_ = _indefinite_root_lock_filters.get(lock_column.key)
+    if filter_ is None:
+        filter_ = _indefinite_root_lock_filters[lock_column.key] = ConditionalRowFilter(
+            base_filter=_get_column_key_filter(lock_column),
+            true_filter=PassAllFilter(True),
+            false_filter=_get_column_key_filter(attributes.Hierarchy.NewParent),
+        )
+    return filter_
 
 
 def get_renew_lock_filter(
     lock_column: attributes._Attribute, operation_id: np.uint64
 ) -> ConditionalRowFilter:
-    new_parents_column = attributes.Hierarchy.NewParent
     operation_id_b = lock_column.serialize(operation_id)
 
     # Build a column filter which tests if a lock was set (== lock column
@@ -225,13 +223,7 @@ def get_renew_lock_filter(
     # is not necessary but we include it as a backup to prevent things
     # from going really bad.
 
-    column_key_filter = ColumnRangeFilter(
-        column_family_id=lock_column.family_id,
-        start_column=lock_column.key,
-        end_column=lock_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
+    column_key_filter = _get_column_key_filter(lock_column)
 
     value_filter = ValueRangeFilter(
         start_value=operation_id_b,
@@ -240,13 +232,7 @@ def get_renew_lock_filter(
         inclusive_end=True,
     )
 
-    new_parents_key_filter = ColumnRangeFilter(
-        column_family_id=new_parents_column.family_id,
-        start_column=new_parents_column.key,
-        end_column=new_parents_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
+    new_parents_key_filter = _get_column_key_filter(attributes.Hierarchy.NewParent)
 
     return ConditionalRowFilter(
         base_filter=RowFilterChain([column_key_filter, value_filter]),
@@ -265,13 +251,7 @@ def get_unlock_root_filter(lock_column, lock_expiry, operation_id) -> RowFilterC
     # exists) and if it is still valid (timestamp younger than
     # LOCK_EXPIRED_TIME_DELTA) and if the given operation_id is still
     # the active lock holder
-    column_key_filter = ColumnRangeFilter(
-        column_family_id=lock_column.family_id,
-        start_column=lock_column.key,
-        end_column=lock_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
+    column_key_filter = _get_column_key_filter(lock_column)
 
     value_filter = ValueRangeFilter(
         start_value=lock_column.serialize(operation_id),
@@ -285,13 +265,7 @@ def get_unlock_root_filter(lock_column, lock_expiry, operation_id) -> RowFilterC
 
 
 def get_indefinite_unlock_root_filter(lock_column, operation_id) -> RowFilterChain:
-    column_key_filter = ColumnRangeFilter(
-        column_family_id=lock_column.family_id,
-        start_column=lock_column.key,
-        end_column=lock_column.key,
-        inclusive_start=True,
-        inclusive_end=True,
-    )
+    column_key_filter = _get_column_key_filter(lock_column)
 
     value_filter = ValueRangeFilter(
         start_value=lock_column.serialize(operation_id),
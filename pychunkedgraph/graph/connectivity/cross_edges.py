@@ -214,6 +214,6 @@ def _read_atomic_chunk(cg, chunk_coord, layers):
         max_children_ids.append(np.max(row_data[child_col][0].value))
 
     row_ids = np.array(row_ids, dtype=basetypes.NODE_ID)
-    segment_ids = np.array([cg.get_segment_id(r_id) for r_id in row_ids])
+    segment_ids = cg.get_segment_ids(row_ids)
     l2ids = filter_failed_node_ids(row_ids, segment_ids, max_children_ids)
     return range_read, l2ids
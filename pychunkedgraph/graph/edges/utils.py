@@ -8,6 +8,7 @@ from typing import Dict
 from typing import Tuple
 from typing import Iterable
 from typing import Optional
+from collections import defaultdict
 
 import fastremap
 import numpy as np
@@ -45,10 +46,27 @@ def concatenate_chunk_edges(chunk_edge_dicts: Iterable) -> Dict:
     return edges_dict
 
 
+def concatenate_edges(edges: Iterable[Edges]) -> Edges:
+    """Combine multiple Edges instances with one copy per field."""
+    sv_ids1 = [np.array([], dtype=basetypes.NODE_ID)]
+    sv_ids2 = [np.array([], dtype=basetypes.NODE_ID)]
+    affinities = [np.array([], dtype=basetypes.EDGE_AFFINITY)]
+    areas = [np.array([], dtype=basetypes.EDGE_AREA)]
+    for edges_ in edges:
+        sv_ids1.append(edges_.node_ids1)
+        sv_ids2.append(edges_.node_ids2)
+        affinities.append(edges_.affinities)
+        areas.append(edges_.areas)
+    return Edges(
+        np.concatenate(sv_ids1),
+        np.concatenate(sv_ids2),
+        affinities=np.concatenate(affinities),
+        areas=np.concatenate(areas),
+    )
+
+
 def concatenate_cross_edge_dicts(edges_ds: Iterable[Dict]) -> Dict:
     """Combines cross chunk edge dicts of form {layer id : edge list}."""
-    from collections import defaultdict
-
     result_d = defaultdict(list)
 
     for edges_d in edges_ds:
@@ -56,7 +74,12 @@ def concatenate_cross_edge_dicts(edges_ds: Iterable[Dict]) -> Dict:
             result_d[layer].append(edges)
 
     for layer, edge_lists in result_d.items():
-        result_d[layer] = np.concatenate(edge_lists)
+        # this runs per node during edits and merges; most layers get
+        # a single contribution, where concatenating would only copy
+        if len(edge_lists) == 1:
+            result_d[layer] = edge_lists[0]
+        else:
+            result_d[layer] = np.concatenate(edge_lists)
     return result_d
 
 
@@ -65,9 +88,8 @@ def merge_cross_edge_dicts(x_edges_d1: Dict, x_edges_d2: Dict) -> Dict:
     Combines two cross chunk dictionaries of form
     {node_id: {layer id : edge list}}.
     """
-    node_ids = np.unique(list(x_edges_d1.keys()) + list(x_edges_d2.keys()))
     result_d = {}
-    for node_id in node_ids:
+    for node_id in set(x_edges_d1) | set(x_edges_d2):
         cross_edge_ds = [x_edges_d1.get(node_id, {}), x_edges_d2.get(node_id, {})]
         result_d[node_id] = concatenate_cross_edge_dicts(cross_edge_ds)
     return result_d
@@ -140,15 +162,31 @@ def get_cross_chunk_edges_layer(meta: ChunkedGraphMeta, cross_edges: Iterable):
     """
     if len(cross_edges) == 0:
         return np.array([], dtype=int)
-    cross_chunk_edge_layers = np.ones(len(cross_edges), dtype=int)
-    coords0 = chunk_utils.get_chunk_coordinates_multiple(meta, cross_edges[:, 0])
-    coords1 = chunk_utils.get_chunk_coordinates_multiple(meta, cross_edges[:, 1])
+    cross_edges = np.asarray(cross_edges, dtype=np.uint64)
+    coords = chunk_utils.get_chunk_coordinates_multiple(meta, cross_edges.ravel())
+    coords = coords.reshape(-1, 2, 3)
+    coords0 = coords[:, 0]
+    coords1 = coords[:, 1]
+
+    fanout = meta.graph_config.FANOUT
+    if fanout & (fanout - 1) == 0:
+        # closed form: the number of divisions by fanout until two
+        # coordinates agree is the bit length of their xor, in units
+        # of log2(fanout) bits
+        log2f = int(np.log2(fanout))
+        diff = np.max(coords0 ^ coords1, axis=1)
+        divisions = np.zeros(len(diff), dtype=int)
+        nonzero = diff > 0
+        divisions[nonzero] = np.log2(diff[nonzero]).astype(int) // log2f + 1
+        np.minimum(divisions, meta.layer_count - 2, out=divisions)
+        return divisions + 1
 
+    cross_chunk_edge_layers = np.ones(len(cross_edges), dtype=int)
     for _ in range(2, meta.layer_count):
         edge_diff = np.sum(np.abs(coords0 - coords1), axis=1)
         cross_chunk_edge_layers[edge_diff > 0] += 1
-        coords0 = coords0 // meta.graph_config.FANOUT
-        coords1 = coords1 // meta.graph_config.FANOUT
+        coords0 = coords0 // fanout
+        coords1 = coords1 // fanout
     return cross_chunk_edge_layers
 
 
@@ -26,8 +26,11 @@ def _init_old_hierarchy(cg, l2ids: np.ndarray, parent_ts: datetime.datetime = No
     new_old_id_d = defaultdict(set)
     old_new_id_d = defaultdict(set)
     old_hierarchy_d = {id_: {2: id_} for id_ in l2ids}
+    # single batched walk for all l2ids; per-id walks cost
+    # one read per id per layer
+    layer_parent_ds = cg.get_all_parents_dicts(l2ids, time_stamp=parent_ts)
     for id_ in l2ids:
-        layer_parent_d = cg.get_all_parents_dict(id_, time_stamp=parent_ts)
+        layer_parent_d = layer_parent_ds[id_]
         old_hierarchy_d[id_].update(layer_parent_d)
         for parent in layer_parent_d.values():
             old_hierarchy_d[parent] = old_hierarchy_d[id_]
@@ -210,9 +213,11 @@ def add_edges(
     graph, _, _, graph_ids = flatgraph.build_gt_graph(edges, make_directed=True)
     components = flatgraph.connected_components(graph)
     new_l2_ids = []
-    for cc_indices in components:
+    # allocate ids for all components in one concurrent batch
+    chunk_ids = [cg.get_chunk_id(graph_ids[cc_indices][0]) for cc_indices in components]
+    new_ids = cg.id_client.create_node_ids_multiple(chunk_ids)
+    for cc_indices, new_id in zip(components, new_ids):
         l2ids_ = graph_ids[cc_indices]
-        new_id = cg.id_client.create_node_id(cg.get_chunk_id(l2ids_[0]))
         cg.cache.children_cache[new_id] = np.concatenate(
             [atomic_children_d[l2id] for l2id in l2ids_]
         )
@@ -482,6 +487,7 @@ class CreateParentNodes:
         components, graph_ids = self._get_connected_components(
             layer_node_ids, layer, lower_layer_ids
         )
+        cc_data = []
         for cc_indices in components:
             parent_layer = layer + 1
             cc_ids = graph_ids[cc_indices]
@@ -492,11 +498,20 @@ class CreateParentNodes:
                     if len(self._cross_edges_d[cc_ids[0]].get(l, types.empty_2d)) > 0:
                         parent_layer = l
                         break
+            cc_data.append((cc_ids, parent_layer))
 
-            parent_id = self.cg.id_client.create_node_id(
-                self.cg.get_parent_chunk_id(cc_ids[0], parent_layer),
-                root_chunk=parent_layer == self.cg.meta.layer_count,
-            )
+        # allocate ids for all components in one concurrent batch
+        parent_ids = self.cg.id_client.create_node_ids_multiple(
+            [
+                self.cg.get_parent_chunk_id(cc_ids[0], parent_layer)
+                for cc_ids, parent_layer in cc_data
+            ],
+            root_chunk_mask=[
+                parent_layer == self.cg.meta.layer_count
+                for _, parent_layer in cc_data
+            ],
+        )
+        for (cc_ids, parent_layer), parent_id in zip(cc_data, parent_ids):
             self._new_ids_d[parent_layer].append(parent_id)
             self.cg.cache.children_cache[parent_id] = cc_ids
             cache_utils.update(
@@ -3,12 +3,36 @@ from typing import Sequence
 from collections import defaultdict
 
 import numpy as np
+from multiwrapper import multiprocessing_utils as mu
 
 from . import exceptions
 from .types import empty_1d
 from .lineage import get_future_root_ids
 
 
+def _get_future_root_ids_dict(cg, root_ids) -> defaultdict:
+    """Collects future root ids for all given roots, one traversal per
+    thread; the traversals are independent and read-bound."""
+    future_root_ids_d = defaultdict(lambda: empty_1d)
+    if len(root_ids) > 1:
+        results = mu.multithread_func(
+            _future_root_ids_thread,
+            params=[(cg, id_) for id_ in root_ids],
+            n_threads=min(len(root_ids), 2 * mu.n_cpus),
+        )
+        for id_, future_ids in results:
+            future_root_ids_d[id_] = future_ids
+    else:
+        for id_ in root_ids:
+            future_root_ids_d[id_] = get_future_root_ids(cg, id_)
+    return future_root_ids_d
+
+
+def _future_root_ids_thread(args):
+    cg, root_id = args
+    return root_id, get_future_root_ids(cg, root_id)
+
+
 class RootLock:
     """Attempts to lock the requested root IDs using a unique operation ID.
     :raises exceptions.LockingError: throws when one or more root ID locks could not be
@@ -55,10 +79,7 @@ class RootLock:
         if not self.operation_id:
             self.operation_id = self.cg.id_client.create_operation_id()
 
-        future_root_ids_d = defaultdict(lambda: empty_1d)
-        for id_ in self.root_ids:
-            future_root_ids_d[id_] = get_future_root_ids(self.cg, id_)
-
+        future_root_ids_d = _get_future_root_ids_dict(self.cg, self.root_ids)
         self.lock_acquired, self.locked_root_ids = self.cg.client.lock_roots(
             root_ids=self.root_ids,
             operation_id=self.operation_id,
@@ -114,9 +135,7 @@ class IndefiniteRootLock:
         if not self.cg.client.renew_locks(self.root_ids, self.operation_id):
             raise exceptions.LockingError("Could not renew locks before writing.")
 
-        future_root_ids_d = defaultdict(lambda: empty_1d)
-        for id_ in self.root_ids:
-            future_root_ids_d[id_] = get_future_root_ids(self.cg, id_)
+        future_root_ids_d = _get_future_root_ids_dict(self.cg, self.root_ids)
         self.acquired, self.root_ids, failed = self.cg.client.lock_roots_indefinitely(
             root_ids=self.root_ids,
             operation_id=self.operation_id,
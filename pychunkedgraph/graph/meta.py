@@ -1,4 +1,5 @@
 import json
+import threading
 from datetime import timedelta
 from typing import Dict
 from typing import List
@@ -64,9 +65,17 @@ class ChunkedGraphMeta:
         self._custom_data = custom_data
 
         self._ws_cv = None
+        self._ws_cv_lock = threading.Lock()
+        self._resolution = None
+        self._voxel_bounds = None
+        self._voxel_counts = None
         self._layer_bounds_d = None
         self._layer_count = None
         self._bitmasks = None
+        self._bits_per_dim_lut = None
+        self._chunk_offset_lut = None
+        self._segment_id_limit_lut = None
+        self._chunk_coord_limit = None
 
     @property
     def graph_config(self):
@@ -85,24 +94,31 @@ class ChunkedGraphMeta:
         if self._ws_cv:
             return self._ws_cv
 
-        cache_key = f"{self.graph_config.ID}:ws_cv_info_cached"
-        try:
-            # try reading a cached info file for distributed workers
-            # useful to avoid md5 errors on high gcs load
-            redis = get_redis_connection()
-            cached_info = json.loads(redis.get(cache_key))
-            self._ws_cv = CloudVolume(self._data_source.WATERSHED, info=cached_info)
-        except Exception:
-            self._ws_cv = CloudVolume(self._data_source.WATERSHED)
+        with self._ws_cv_lock:
+            # double-checked; concurrent requests must not each construct
+            # a CloudVolume (info fetch + auth round-trips)
+            if self._ws_cv:
+                return self._ws_cv
+            cache_key = f"{self.graph_config.ID}:ws_cv_info_cached"
             try:
-                redis.set(cache_key, json.dumps(self._ws_cv.info))
+                # try reading a cached info file for distributed workers
+                # useful to avoid md5 errors on high gcs load
+                redis = get_redis_connection()
+                cached_info = json.loads(redis.get(cache_key))
+                self._ws_cv = CloudVolume(self._data_source.WATERSHED, info=cached_info)
             except Exception:
-                ...
+                self._ws_cv = CloudVolume(self._data_source.WATERSHED)
+                try:
+                    redis.set(cache_key, json.dumps(self._ws_cv.info))
+                except Exception:
+                    ...
         return self._ws_cv
 
     @property
     def resolution(self):
-        return self.ws_cv.resolution  # pylint: disable=no-member
+        if self._resolution is None:
+            self._resolution = self.ws_cv.resolution  # pylint: disable=no-member
+        return self._resolution
 
     @property
     def layer_count(self) -> int:
@@ -127,6 +143,10 @@ class ChunkedGraphMeta:
             self._layer_count,
             s_bits_atomic_layer=self._graph_config.SPATIAL_BITS,
         )
+        self._bits_per_dim_lut = None
+        self._chunk_offset_lut = None
+        self._segment_id_limit_lut = None
+        self._chunk_coord_limit = None
 
     @property
     def cv(self):
@@ -143,20 +163,51 @@ class ChunkedGraphMeta:
         )
         return self._bitmasks
 
+    @property
+    def bits_per_dim_lut(self) -> np.ndarray:
+        """Layer-indexed array version of `bitmasks` for vectorized bit math."""
+        if self._bits_per_dim_lut is None:
+            lut = np.zeros(self.layer_count + 1, dtype=np.uint64)
+            for layer, bits in self.bitmasks.items():
+                lut[layer] = bits
+            self._bits_per_dim_lut = lut
+        return self._bits_per_dim_lut
+
+    @property
+    def chunk_offset_lut(self) -> np.ndarray:
+        """Layer-indexed array of segment id bit counts."""
+        if self._chunk_offset_lut is None:
+            self._chunk_offset_lut = (
+                np.uint64(64 - self._graph_config.LAYER_ID_BITS)
+                - np.uint64(3) * self.bits_per_dim_lut
+            )
+        return self._chunk_offset_lut
+
+    @property
+    def segment_id_limit_lut(self) -> np.ndarray:
+        """Layer-indexed array of maximum possible segment ids."""
+        if self._segment_id_limit_lut is None:
+            self._segment_id_limit_lut = (
+                np.uint64(1) << self.chunk_offset_lut
+            ) - np.uint64(1)
+        return self._segment_id_limit_lut
+
     @property
     def voxel_bounds(self):
-        bounds = np.array(self.ws_cv.bounds.to_list())  # pylint: disable=no-member
-        return bounds.reshape(2, -1).T
+        if self._voxel_bounds is None:
+            bounds = np.array(self.ws_cv.bounds.to_list())  # pylint: disable=no-member
+            self._voxel_bounds = bounds.reshape(2, -1).T
+        return self._voxel_bounds
 
     @property
     def voxel_counts(self) -> Sequence[int]:
         """returns number of voxels in each dimension"""
-        cv_bounds = np.array(self.ws_cv.bounds.to_list())  # pylint: disable=no-member
-        cv_bounds = cv_bounds.reshape(2, -1).T
-        voxel_counts = cv_bounds.copy()
-        voxel_counts -= cv_bounds[:, 0:1]  # pylint: disable=unsubscriptable-object
-        voxel_counts = voxel_counts[:, 1]
-        return voxel_counts
+        if self._voxel_counts is None:
+            cv_bounds = self.voxel_bounds
+            voxel_counts = cv_bounds.copy()
+            voxel_counts -= cv_bounds[:, 0:1]  # pylint: disable=unsubscriptable-object
+            self._voxel_counts = voxel_counts[:, 1]
+        return self._voxel_counts
 
     @property
     def layer_chunk_bounds(self) -> Dict:
@@ -285,6 +336,16 @@ class ChunkedGraphMeta:
         return meta_str
 
     def is_out_of_bounds(self, chunk_coordinate):
-        return np.any(chunk_coordinate < 0) or np.any(
-            chunk_coordinate > 2 ** self.bitmasks[1]
-        )
+        # plain python comparisons; numpy dispatch dwarfs the
+        # three compares for per-chunk calls in ingest loops
+        if self._chunk_coord_limit is None:
+            self._chunk_coord_limit = 2 ** self.bitmasks[1]
+        limit = self._chunk_coord_limit
+        x, y, z = chunk_coordinate
+        return x < 0 or y < 0 or z < 0 or x > limit or y > limit or z > limit
+
+    def is_out_of_bounds_multiple(self, chunk_coordinates) -> np.ndarray:
+        """Array version of is_out_of_bounds for (N, 3) coordinates."""
+        coords = np.asarray(chunk_coordinates)
+        limit = 2 ** self.bitmasks[1]
+        return np.any((coords < 0) | (coords > limit), axis=1)
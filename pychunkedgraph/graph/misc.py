@@ -212,14 +212,22 @@ def get_contact_sites(
     # connected components in this graph will be combined in one component
     ccs = flatgraph.connected_components(graph)
     cs_dict = collections.defaultdict(list)
+    cc_sv_ids_list = []
     for cc in ccs:
         cc_sv_ids = unique_ids[cc]
-        cc_sv_ids = cc_sv_ids[np.in1d(cc_sv_ids, u_cs_svs)]
+        cc_sv_ids_list.append(cc_sv_ids[np.in1d(cc_sv_ids, u_cs_svs)])
+    partner_roots = None
+    if compute_partner and cc_sv_ids_list:
+        # one batched root lookup for all components
+        # instead of one hierarchy walk per component
+        representatives = np.array(
+            [cc_sv_ids[0] for cc_sv_ids in cc_sv_ids_list], dtype=np.uint64
+        )
+        partner_roots = cg.get_roots(representatives, time_stamp=time_stamp)
+    for i, cc_sv_ids in enumerate(cc_sv_ids_list):
         cs_areas = area_dict_vec(cc_sv_ids)
         partner_root_id = (
-            int(cg.get_root(cc_sv_ids[0], time_stamp=time_stamp))
-            if compute_partner
-            else len(cs_dict)
+            int(partner_roots[i]) if compute_partner else len(cs_dict)
         )
         cs_dict[partner_root_id].append(np.sum(cs_areas))
     return cs_dict
@@ -249,17 +249,44 @@ class SegmentHistory:
             assert root_id in self.root_ids
             root_ids = [root_id]
 
+        # fetch only the columns a merge log needs instead of full log rows;
+        # splits/undos are skipped by the missing AddedEdge column
+        properties = [
+            OperationLogs.AddedEdge,
+            OperationLogs.SourceCoordinate,
+            OperationLogs.SinkCoordinate,
+            OperationLogs.OperationTimeStamp,
+            OperationLogs.RootID,
+        ]
+
         added_edges = []
         added_edge_coords = []
 
+        # one log read for all roots instead of one per root
+        operation_ids_d = {
+            root_id: self.past_operation_ids(root_id=root_id) for root_id in root_ids
+        }
+        all_operation_ids = fastremap.unique(
+            np.concatenate(list(operation_ids_d.values()))
+        )
+        log_rows = {}
+        if all_operation_ids.size:
+            log_rows = self.cg.client.read_log_entries(
+                all_operation_ids, properties=properties
+            )
         for root_id in root_ids:
-            for operation_id in self.past_operation_ids(root_id=root_id):
-                log_entry = self.log_entry(operation_id)
-                if not log_entry.is_merge:
+            for operation_id in operation_ids_d[root_id]:
+                log_row = log_rows.get(operation_id)
+                if log_row is None or OperationLogs.AddedEdge not in log_row:
                     continue
 
-                added_edges.append(log_entry.added_edges)
-                coords = log_entry.coordinates
+                added_edges.append(log_row[OperationLogs.AddedEdge])
+                coords = np.array(
+                    [
+                        log_row[OperationLogs.SourceCoordinate],
+                        log_row[OperationLogs.SinkCoordinate],
+                    ]
+                )
                 if correct_for_wrong_coord_type:
                     # A little hack because we got the datatype wrong...
                     coords = [np.frombuffer(coords[0]), np.frombuffer(coords[1])]
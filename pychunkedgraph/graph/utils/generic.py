@@ -166,21 +166,16 @@ def mask_nodes_by_bounding_box(
     if bounding_box is None:
         return np.ones(len(nodes), bool)
     else:
-        chunk_coordinates = np.array(
-            [chunk_utils.get_chunk_coordinates(meta, c) for c in nodes]
-        )
+        chunk_coordinates = chunk_utils.get_chunk_coordinates_multiple(meta, nodes)
         layers = chunk_utils.get_chunk_layers(meta, nodes)
         adapt_layers = layers - 2
         adapt_layers[adapt_layers < 0] = 0
         fanout = meta.graph_config.FANOUT
-        bounding_box_layer = (
-            bounding_box[None] / (fanout ** adapt_layers)[:, None, None]
-        )
-        bound_check = np.array(
-            [
-                np.all(chunk_coordinates < bounding_box_layer[:, 1], axis=1),
-                np.all(chunk_coordinates + 1 > bounding_box_layer[:, 0], axis=1),
-            ]
-        ).T
-
-        return np.all(bound_check, axis=1)
\ No newline at end of file
+        # bounding box scaled to each node's layer; a single fused
+        # comparison avoids stacking intermediate (N, 2) arrays
+        scale = (fanout ** adapt_layers)[:, None]
+        lower = bounding_box[0] / scale
+        upper = bounding_box[1] / scale
+        return (
+            (chunk_coordinates < upper) & (chunk_coordinates + 1 > lower)
+        ).all(axis=1)
\ No newline at end of file
@@ -6,6 +6,7 @@ from typing import Optional
 from typing import Sequence
 from typing import Callable
 from datetime import datetime
+from collections import Counter
 
 import numpy as np
 
@@ -19,8 +20,7 @@ def get_segment_id_limit(
 ) -> basetypes.SEGMENT_ID:
     """Get maximum possible Segment ID for given Node ID or Chunk ID."""
     layer = chunk_utils.get_chunk_layer(meta, node_or_chunk_id)
-    chunk_offset = 64 - meta.graph_config.LAYER_ID_BITS - 3 * meta.bitmasks[layer]
-    return np.uint64(2 ** chunk_offset - 1)
+    return meta.segment_id_limit_lut[layer]
 
 
 def get_segment_id(
@@ -30,6 +30,15 @@ def get_segment_id(
     return node_id & get_segment_id_limit(meta, node_id)
 
 
+def get_segment_ids(
+    meta: ChunkedGraphMeta, node_ids: Sequence[basetypes.NODE_ID]
+) -> np.ndarray:
+    """Array version of get_segment_id."""
+    node_ids = np.asarray(node_ids, dtype=basetypes.NODE_ID)
+    layers = chunk_utils.get_chunk_layers(meta, node_ids)
+    return node_ids & meta.segment_id_limit_lut[layers]
+
+
 def get_node_id(
     meta: ChunkedGraphMeta,
     segment_id: basetypes.SEGMENT_ID,
@@ -51,7 +60,7 @@ def get_node_id(
 
 def get_atomic_id_from_coord(
     meta: ChunkedGraphMeta,
-    get_root: callable,
+    get_roots: Callable,
     x: int,
     y: int,
     z: int,
@@ -64,9 +73,9 @@ def get_atomic_id_from_coord(
     y = int(y / 2 ** meta.data_source.CV_MIP)
     z = int(z)
 
-    checked = []
+    checked = set()
     atomic_id = None
-    root_id = get_root(parent_id, time_stamp=time_stamp)
+    root_id = get_roots(np.array([parent_id]), time_stamp=time_stamp)[0]
 
     for i_try in range(n_tries):
         # Define block size -- increase by one each try
@@ -84,25 +93,33 @@ def get_atomic_id_from_coord(
 
         # Get atomic ids from cloudvolume
         atomic_id_block = meta.cv[x_l:x_h, y_l:y_h, z_l:z_h]
-        atomic_ids, atomic_id_count = np.unique(atomic_id_block, return_counts=True)
 
         # sort by frequency and discard those ids that have been checked
-        # previously
-        sorted_atomic_ids = atomic_ids[np.argsort(atomic_id_count)]
-        sorted_atomic_ids = sorted_atomic_ids[~np.in1d(sorted_atomic_ids, checked)]
-
-        # For each candidate id check whether its root id corresponds to the
-        # given root id
-        for candidate_atomic_id in sorted_atomic_ids:
-            if candidate_atomic_id != 0:
-                ass_root_id = get_root(candidate_atomic_id, time_stamp=time_stamp)
-                if ass_root_id == root_id:
-                    # atomic_id is not None will be our indicator that the
-                    # search was successful
-                    atomic_id = candidate_atomic_id
-                    break
-                else:
-                    checked.append(candidate_atomic_id)
+        # previously; blocks are a few thousand voxels at most, where
+        # Counter beats the numpy unique/argsort setup cost
+        counts = Counter(atomic_id_block.ravel().tolist())
+        counts.pop(0, None)
+        candidates = np.array(
+            [
+                id_
+                for id_, _ in reversed(counts.most_common())
+                if id_ not in checked
+            ],
+            dtype=basetypes.NODE_ID,
+        )
+        if not candidates.size:
+            continue
+
+        # look up all candidate roots in one batched read
+        # instead of one hierarchy walk per candidate
+        candidate_roots = get_roots(candidates, time_stamp=time_stamp)
+        for candidate_atomic_id, candidate_root in zip(candidates, candidate_roots):
+            if candidate_root == root_id:
+                # atomic_id is not None will be our indicator that the
+                # search was successful
+                atomic_id = candidate_atomic_id
+                break
+            checked.add(candidate_atomic_id)
         if atomic_id is not None:
             break
     # Returns None if unsuccessful
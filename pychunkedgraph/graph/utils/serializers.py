@@ -1,10 +1,35 @@
 from typing import Any, Iterable
 import json
 import pickle
+import threading
 
 import numpy as np
 import zstandard as zstd
 
+# compression contexts are expensive to create and not thread-safe,
+# so they are cached per thread instead of per call
+_zstd_contexts = threading.local()
+
+
+def _zstd_compressor(level: int) -> zstd.ZstdCompressor:
+    try:
+        compressors = _zstd_contexts.compressors
+    except AttributeError:
+        compressors = _zstd_contexts.compressors = {}
+    try:
+        return compressors[level]
+    except KeyError:
+        compressor = compressors[level] = zstd.ZstdCompressor(level=level)
+        return compressor
+
+
+def _zstd_decompressor() -> zstd.ZstdDecompressor:
+    try:
+        return _zstd_contexts.decompressor
+    except AttributeError:
+        decompressor = _zstd_contexts.decompressor = zstd.ZstdDecompressor()
+        return decompressor
+
 
 class _Serializer:
     def __init__(self, serializer, deserializer, basetype=Any, compression_level=None):
@@ -16,12 +41,12 @@ class _Serializer:
     def serialize(self, obj):
         content = self._serializer(obj)
         if self._compression_level:
-            return zstd.ZstdCompressor(level=self._compression_level).compress(content)
+            return _zstd_compressor(self._compression_level).compress(content)
         return content
 
     def deserialize(self, obj):
         if self._compression_level:
-            obj = zstd.ZstdDecompressor().decompressobj().decompress(obj)
+            obj = _zstd_decompressor().decompressobj().decompress(obj)
         return self._deserializer(obj)
 
     @property
@@ -117,6 +142,23 @@ def serialize_uint64(node_id: np.uint64, counter=False, fake_edges=False) -> byt
     return serialize_key(pad_node_id(node_id))  # type: ignore
 
 
+def serialize_uint64s(
+    node_ids: Iterable[np.uint64], counter=False, fake_edges=False
+) -> list:
+    """ Bulk version of serialize_uint64; one vectorized pass over all ids
+
+    :param node_ids: iterable of int
+    :return: list of bytes
+    """
+    node_ids = np.asarray(node_ids, dtype=np.uint64)
+    keys = np.char.zfill(node_ids.astype("U20"), 20)
+    if counter:
+        keys = np.char.add("i", keys)
+    elif fake_edges:
+        keys = np.char.add("f", keys)
+    return np.char.encode(keys, "utf-8").tolist()
+
+
 def serialize_uint64s_to_regex(node_ids: Iterable[np.uint64]) -> bytes:
     """ Serializes an id to be ingested by a bigtable table row
 
@@ -138,6 +180,20 @@ def deserialize_uint64(node_id: bytes, fake_edges=False) -> np.uint64:
     return np.uint64(node_id.decode())  # type: ignore
 
 
+def deserialize_uint64s(
+    row_keys: Iterable[bytes], fake_edges=False
+) -> np.ndarray:
+    """ Bulk version of deserialize_uint64
+
+    :param row_keys: iterable of bytes
+    :return: np.ndarray of np.uint64
+    """
+    keys = np.array(list(row_keys), dtype="S21")
+    if fake_edges:
+        keys = np.char.lstrip(keys, b"f")
+    return keys.astype(np.uint64)
+
+
 def serialize_key(key: str) -> bytes:
     """ Serializes a key to be ingested by a bigtable table row
 
@@ -125,7 +125,7 @@ def _read_chunk(children_ids_shared, cg: ChunkedGraph, layer_id: int, chunk_coor
         row_ids.append(row_id)
         max_children_ids.append(np.max(row_data[0].value))
     row_ids = np.array(row_ids, dtype=basetypes.NODE_ID)
-    segment_ids = np.array([cg.get_segment_id(r_id) for r_id in row_ids])
+    segment_ids = cg.get_segment_ids(row_ids)
 
     row_ids = filter_failed_node_ids(row_ids, segment_ids, max_children_ids)
     children_ids_shared.append(row_ids)
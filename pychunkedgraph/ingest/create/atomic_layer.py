@@ -116,9 +116,16 @@ def _process_component(
     cce_layers = cg.get_cross_chunk_edges_layer(chunk_out_edges)
     u_cce_layers = np.unique(cce_layers)
 
+    # group edges by layer in one pass instead of one mask scan per layer
+    order = np.argsort(cce_layers, kind="stable")
+    sorted_out_edges = chunk_out_edges[order]
+    boundaries = np.searchsorted(cce_layers[order], u_cce_layers, side="right")
+
     val_dict = {attributes.Hierarchy.Child: node_ids}
-    for cc_layer in u_cce_layers:
-        layer_out_edges = chunk_out_edges[cce_layers == cc_layer]
+    start = 0
+    for cc_layer, end in zip(u_cce_layers, boundaries):
+        layer_out_edges = sorted_out_edges[start:end]
+        start = end
         if layer_out_edges.size:
             col = attributes.Connectivity.CrossChunkEdge[cc_layer]
             val_dict[col] = layer_out_edges
@@ -234,7 +234,7 @@ def _collect_edge_data(imanager: IngestionManager, chunk_coord):
     in_fnames = []
     x, y, z = chunk_coord
     for _x, _y, _z in product([x - 1, x], [y - 1, y], [z - 1, z]):
-        if cg_meta.is_out_of_bounds(np.array([_x, _y, _z])):
+        if cg_meta.is_out_of_bounds((_x, _y, _z)):
             continue
         filename = f"in_chunk_0_{_x}_{_y}_{_z}.data"
         in_fnames.append(filename)
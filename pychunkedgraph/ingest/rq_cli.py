@@ -5,7 +5,6 @@ import os
 import sys
 
 import click
-from redis import Redis
 from rq import Queue
 from rq import Worker
 from rq.worker import WorkerStatus
@@ -17,14 +16,12 @@ from rq.registry import FailedJobRegistry
 from flask import current_app
 from flask.cli import AppGroup
 
-from ..utils.redis import REDIS_HOST
-from ..utils.redis import REDIS_PORT
-from ..utils.redis import REDIS_PASSWORD
+from ..utils.redis import get_redis_connection
 
 
 # rq extended
 rq_cli = AppGroup("rq")
-connection = Redis(host=REDIS_HOST, port=REDIS_PORT, db=0, password=REDIS_PASSWORD)
+connection = get_redis_connection()
 
 
 @rq_cli.command("status")
@@ -49,8 +46,12 @@ def get_status(queues, show_busy):
 @click.argument("job_ids", nargs=-1)
 def failed_jobs(queue, job_ids):
     if job_ids:
-        for job_id in job_ids:
-            j = Job.fetch(job_id, connection=connection)
+        # fetch_many pipelines the reads, one round-trip for all jobs
+        jobs = Job.fetch_many(job_ids, connection=connection)
+        for job_id, j in zip(job_ids, jobs):
+            if j is None:
+                print(f"JOB ID {job_id} not found")
+                continue
             print(f"JOB ID {job_id}")
             print("KWARGS")
             print(j.kwargs)
@@ -72,7 +72,10 @@ def get_chunk_edges(edges_dir: str, chunks_coordinates: List[np.ndarray]) -> Dic
         # filename format - edges_x_y_z.serialization.compression
         fnames.append(f"edges_{chunk_str}.proto.zst")
 
-    cf = CloudFiles(edges_dir, num_threads=4)
+    # scale download concurrency with the number of chunk files;
+    # a fixed pool underutilizes large reads and adds thread
+    # overhead when a single chunk is requested
+    cf = CloudFiles(edges_dir, num_threads=min(len(fnames), 16))
     files = cf.get(fnames, raw=True)
     compressed = []
     for f in files:
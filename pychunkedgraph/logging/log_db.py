@@ -18,13 +18,18 @@ EXCLUDE_FROM_INDEX = os.environ.get(
 )
 EXCLUDE_FROM_INDEX = tuple(attr.strip() for attr in EXCLUDE_FROM_INDEX.split(","))
 
+LOG_Q_SIZE = 10000
+LOG_BATCH_SIZE = 100
+
 
 class LogDB:
     def __init__(self, graph_id: str, client: DatastoreFlex):
         self._graph_id = graph_id
         self._client = client
         self._kind = f"server_logs_{self._graph_id}"
-        self._q = queue.Queue()
+        # bounded; drop logs instead of growing without limit
+        # if the writer thread can't keep up
+        self._q = queue.Queue(maxsize=LOG_Q_SIZE)
 
     @property
     def graph_id(self):
@@ -54,7 +59,7 @@ class LogDB:
         }
         if operation_id is not None:
             item["operation_id"] = int(operation_id)
-        self._q.put(item)
+        self._put(item)
 
     def log_code_block(self, name: str, operation_id, timestamp, time_ms, **kwargs):
         item = {
@@ -64,20 +69,35 @@ class LogDB:
             "time_ms": time_ms,
         }
         item.update(kwargs)
-        self._q.put(item)
+        self._put(item)
+
+    def _put(self, item):
+        try:
+            self._q.put_nowait(item)
+        except queue.Full:
+            ...
 
     def log_entity(self):
         while True:
             try:
-                item = self._q.get_nowait()
+                items = [self._q.get(timeout=1)]
+            except queue.Empty:
+                continue
+            # drain whatever else is queued and write in one RPC
+            while len(items) < LOG_BATCH_SIZE:
+                try:
+                    items.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            entities = []
+            for item in items:
                 key = self.client.key(self._kind, namespace=self._client.namespace)
                 entity = self.client.entity(
                     key, exclude_from_indexes=EXCLUDE_FROM_INDEX
                 )
                 entity.update(item)
-                self.client.put(entity)
-            except queue.Empty:
-                time.sleep(1)
+                entities.append(entity)
+            self.client.put_multi(entities)
 
 
 def get_log_db(graph_id: str) -> LogDB:
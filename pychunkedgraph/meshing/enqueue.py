@@ -0,0 +1,75 @@
+"""
+Buffered submission of mesh jobs.
+"""
+
+import threading
+import time
+from collections import deque
+
+from rq import Queue as RQueue
+
+from ..utils.redis import get_rq_queue
+
+
+FLUSH_INTERVAL_S = 0.05
+MAX_BATCH = 256
+
+
+class MeshEnqueueBuffer:
+    """
+    Accumulates mesh jobs and submits them with a single redis
+    round-trip per batch. Bursts of edits would otherwise pay
+    several round-trips per job.
+    """
+
+    def __init__(
+        self,
+        queue_name: str = "mesh",
+        flush_interval: float = FLUSH_INTERVAL_S,
+        max_batch: int = MAX_BATCH,
+    ):
+        self._queue_name = queue_name
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._jobs = deque()
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def enqueue(self, func, args, job_timeout: str = "10m"):
+        self._jobs.append(
+            RQueue.prepare_data(
+                func,
+                args=args,
+                timeout=job_timeout,
+                result_ttl=0,
+            )
+        )
+        self._ensure_flush_thread()
+        self._event.set()
+
+    def _ensure_flush_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._thread.start()
+
+    def _flush_loop(self):
+        queue = get_rq_queue(self._queue_name)
+        while True:
+            self._event.wait()
+            self._event.clear()
+            # let a burst accumulate before flushing
+            time.sleep(self._flush_interval)
+            batch = []
+            while self._jobs and len(batch) < self._max_batch:
+                batch.append(self._jobs.popleft())
+            if batch:
+                queue.enqueue_many(batch)
+            if self._jobs:
+                self._event.set()
+
+
+mesh_enqueue_buffer = MeshEnqueueBuffer()
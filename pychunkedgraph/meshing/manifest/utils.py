@@ -40,7 +40,11 @@ def _get_children(cg, node_ids: Sequence[np.uint64], children_cache: Dict):
     if len(node_ids) == 0:
         return empty_1d.copy()
     node_ids = np.array(node_ids, dtype=NODE_ID)
-    mask = np.in1d(node_ids, np.fromiter(children_cache.keys(), dtype=NODE_ID))
+    # direct membership checks; materializing all cached keys
+    # scales with cache size rather than request size
+    mask = np.fromiter(
+        (id_ in children_cache for id_ in node_ids), dtype=bool, count=len(node_ids)
+    )
     children_d = cg.get_children(node_ids[~mask])
     children_cache.update(children_d)
 
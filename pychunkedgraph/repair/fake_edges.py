@@ -13,11 +13,32 @@ environ["BIGTABLE_PROJECT"] = "<>"
 environ["BIGTABLE_INSTANCE"] = "<>"
 environ["GOOGLE_APPLICATION_CREDENTIALS"] = "<path>"
 
+from rq import Queue as RQueue
+
 from pychunkedgraph.graph import edits
 from pychunkedgraph.graph import ChunkedGraph
 from pychunkedgraph.graph.operation import GraphEditOperation
 from pychunkedgraph.graph.operation import MergeOperation
 from pychunkedgraph.graph.utils.generic import get_bounding_box as get_bbox
+from pychunkedgraph.utils.redis import get_redis_connection
+from pychunkedgraph.utils.redis import get_rq_queue
+
+JOB_BATCH_SIZE = 10000
+# keep finished jobs around briefly so estimate_workers can sample
+# service times from the finished job registry; with a ttl of 0 rq
+# deletes jobs on success and the registry stays empty
+RESULT_TTL_S = 300
+
+# one graph instance per worker process, not per job
+_CG_CACHE = {}
+
+
+def _get_cached_cg(graph_id: str) -> ChunkedGraph:
+    try:
+        return _CG_CACHE[graph_id]
+    except KeyError:
+        _CG_CACHE[graph_id] = ChunkedGraph(graph_id=graph_id)
+        return _CG_CACHE[graph_id]
 
 
 def _add_fake_edges(cg: ChunkedGraph, operation_id: int, operation_log: dict) -> bool:
@@ -76,3 +97,89 @@ def add_fake_edges(
     logs = cg.client.read_log_entries(start_time=start_time, end_time=end_time)
     for _id, _log in logs.items():
         _add_fake_edges(cg, _id, _log)
+
+
+def fake_edge_task(graph_id: str, operation_id: int):
+    """Worker task; replays a single merge operation."""
+    cg = _get_cached_cg(graph_id)
+    _log = cg.client.read_log_entries([operation_id])[operation_id]
+    result = _add_fake_edges(cg, operation_id, _log)
+    redis = get_redis_connection()
+    redis.hset("c", str(operation_id), int(result))
+
+
+def enqueue_operation_tasks(
+    graph_id: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+):
+    """
+    Replay operations with workers.
+    Jobs are submitted in batches with a single redis round-trip each,
+    enqueueing one at a time is too slow for a large number of operations.
+    """
+    cg = ChunkedGraph(graph_id=graph_id)
+    logs = cg.client.read_log_entries(start_time=start_time, end_time=end_time)
+    fake_edges_q = get_rq_queue("fake")
+
+    job_datas = []
+    for _id in logs:
+        job_datas.append(
+            RQueue.prepare_data(
+                fake_edge_task,
+                args=(cg.graph_id, _id),
+                timeout="5m",
+                result_ttl=RESULT_TTL_S,
+                job_id=f"fake_{_id}",
+            )
+        )
+        if len(job_datas) % JOB_BATCH_SIZE == 0:
+            fake_edges_q.enqueue_many(job_datas)
+            job_datas = []
+    fake_edges_q.enqueue_many(job_datas)
+    redis = get_redis_connection()
+    redis.set("fake_edge_operations", len(logs))
+
+
+def status():
+    """Progress of replay tasks; single pipelined round-trip."""
+    redis = get_redis_connection()
+    pipe = redis.pipeline(transaction=False)
+    pipe.hlen("c")
+    pipe.get("fake_edge_operations")
+    completed, total = pipe.execute()
+    print(f"completed: {completed} / {int(total) if total else '?'}")
+
+
+def estimate_workers(target_drain_time_s: float = 3600.0, sample_size: int = 100):
+    """
+    Queueing rule of thumb for scaling replay workers:
+    workers = queue_depth * avg_service_time / target_drain_time.
+    Service time is sampled from jobs finished within RESULT_TTL_S.
+    """
+    from math import ceil
+
+    from rq.job import Job
+
+    fake_edges_q = get_rq_queue("fake")
+    job_ids = fake_edges_q.finished_job_registry.get_job_ids(0, sample_size - 1)
+    jobs = Job.fetch_many(job_ids, connection=fake_edges_q.connection)
+
+    durations = [
+        (j.ended_at - j.started_at).total_seconds()
+        for j in jobs
+        if j is not None and j.ended_at is not None and j.started_at is not None
+    ]
+    if not durations:
+        print("no finished jobs to sample service time from")
+        return None
+
+    avg_service_time = sum(durations) / len(durations)
+    queue_depth = fake_edges_q.count
+    workers = ceil(queue_depth * avg_service_time / target_drain_time_s)
+    print(
+        f"queue depth: {queue_depth}, "
+        f"avg service time: {avg_service_time:.2f}s, "
+        f"workers to drain in {target_drain_time_s:.0f}s: {workers}"
+    )
+    return workers
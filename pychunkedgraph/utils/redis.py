@@ -19,6 +19,9 @@ REDIS_PORT = os.environ.get(
 REDIS_PASSWORD = os.environ.get("REDIS_PASSWORD", "")
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/0"
 
+# shared across connections/queues so each one doesn't open its own socket
+REDIS_CONNECTION_POOL = redis.ConnectionPool.from_url(REDIS_URL, max_connections=100)
+
 keys_fields = ("INGESTION_MANAGER",)
 keys_defaults = ("pcg:imanager",)
 Keys = namedtuple("keys", keys_fields, defaults=keys_defaults)
@@ -27,9 +30,11 @@ keys = Keys()
 
 
 def get_redis_connection(redis_url=REDIS_URL):
+    if redis_url == REDIS_URL:
+        return redis.Redis(connection_pool=REDIS_CONNECTION_POOL)
     return redis.Redis.from_url(redis_url)
 
 
 def get_rq_queue(queue):
-    connection = redis.Redis.from_url(REDIS_URL)
+    connection = redis.Redis(connection_pool=REDIS_CONNECTION_POOL)
     return Queue(queue, connection=connection)